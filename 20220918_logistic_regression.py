@@ -3,6 +3,14 @@ import pandas as pd
 from manim import *
 import os 
 
+from threemds import tex_cache
+from threemds.datasets import load_csv
+from threemds.mobjects import FastNumberLabel, TrackedLine, TrackedPlot, point_from_proportion
+from threemds.trackers import Derived
+
+# compile each distinct Tex string once, shared by every scene and run
+tex_cache.install()
+
 class DataPoint(Dot):
     def __init__(self, point: list | np.ndarray, x: float, y: float, color, **kwargs):
         super().__init__(point=point, radius=.15, color=color, **kwargs)
@@ -28,19 +36,19 @@ def create_model(data: pd.DataFrame, initial_m: float, initial_b: float) -> tupl
 
     # plot function
     f = lambda x: 1.0 / (1.0 + math.exp(-(b_tracker.get_value() + m_tracker.get_value() * x)))
-    plot = always_redraw(lambda: ax.plot(f, color=YELLOW))
+    plot = TrackedPlot(ax, f, color=YELLOW, depends_on=(m_tracker, b_tracker))
 
     # max line
     max_line = DashedLine(start=ax.c2p(0, 1), end=ax.c2p(10, 1), color=WHITE)
 
     # likelihood_lines
     likelihood_lines = [
-        always_redraw(
-            lambda p=p: DashedLine(
-                start=p.get_center(),
-                end=ax.c2p(p.x, f(p.x)),
-                color=p.get_color()
-            )
+        TrackedLine(
+            start=p.get_center,
+            end=lambda p=p: ax.c2p(p.x, f(p.x)),
+            dashed=True,
+            color=p.get_color(),
+            depends_on=(m_tracker, b_tracker, p)
         )
         for p in points
     ]
@@ -55,7 +63,7 @@ class LogisticRegressionScene(Scene):
         url = r"https://raw.githubusercontent.com/thomasnield/machine-learning-demo-data/master/classification/simple_logistic_regression.csv"
 
         data, m_tracker, b_tracker, ax, points, true_points, false_points, \
-            plot, f, max_line, likelihood_lines = create_model(data=pd.read_csv(url),
+            plot, f, max_line, likelihood_lines = create_model(data=load_csv(url),
                                                                initial_m=0.69267212,
                                                                initial_b=-3.17576395
                                                                )
@@ -129,22 +137,26 @@ class LogisticRegressionScene(Scene):
         # trace the curve
         alpha_tracker = ValueTracker(.65)
 
+        # the traced point, shared by the dot and its label and only looked up again when alpha or the curve moves
+        trace_point = Derived(lambda: point_from_proportion(plot, alpha_tracker.get_value()), alpha_tracker, plot)
+        trace_coords = Derived(lambda: ax.p2c(trace_point.get_value()), trace_point)
+
         # the trace dot that follows the curve
         class TraceDot(Dot):
-            def __init__(self, alpha: float):
-                self.point = plot.point_from_proportion(alpha)
+            def __init__(self, point):
+                self.point = point
                 super().__init__(point=self.point, color=YELLOW)
 
                 self.x = ax.p2c(self.point)[0]
                 self.y = ax.p2c(self.point)[1]
 
-        trace_dot: TraceDot = always_redraw(lambda: TraceDot(alpha_tracker.get_value()))
+        trace_dot = TraceDot(trace_point.get_value())
+        trace_dot.add_updater(lambda m: m.move_to(trace_point.get_value()))
 
         # Have a label chase the trace
-        trace_label = always_redraw(lambda: MathTex(round(TraceDot(alpha_tracker.get_value()).y, 2)) \
-            .scale(.75) \
-            .next_to(trace_dot, UL)
-        )
+        trace_label = FastNumberLabel(trace_coords.get_value()[1]).scale(.75)
+        trace_label.add_updater(lambda m: m.set_value(trace_coords.get_value()[1]).next_to(trace_dot, UL),
+                                call_updater=True)
 
         self.play(Write(trace_dot), Write(trace_label))
         self.wait()
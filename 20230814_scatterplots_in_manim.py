@@ -2,6 +2,9 @@ from manim import *
 import pandas as pd
 import os
 
+from threemds.datasets import load_csv
+from threemds.mobjects import PointCloudPlot, WritePoints
+
 
 class ScatterPlotScene(Scene):
 
@@ -9,16 +12,15 @@ class ScatterPlotScene(Scene):
         # Download data and put in DataFrame
         data_url = "https://raw.githubusercontent.com/thomasnield/machine-learning-demo-data/master/regression/linear_normal.csv"
 
-        df = pd.read_csv(data_url)
+        df = load_csv(data_url)
 
         # Add the Axes
         ax = Axes(x_range=[0, 100, 5], y_range=[-20, 200, 10])
         self.add(ax)
 
         # Add the dots
-        for x, y in df.values:
-            dot = Dot(ax.c2p(x, y), color=BLUE)
-            self.add(dot)
+        dots = PointCloudPlot(ax, df.iloc[:, 0], df.iloc[:, 1], color=BLUE)
+        self.add(dots)
 
 
 class ScatterPlotAnimatedScene(Scene):
@@ -27,7 +29,7 @@ class ScatterPlotAnimatedScene(Scene):
         # Download data and put in DataFrame
         data_url = "https://raw.githubusercontent.com/thomasnield/machine-learning-demo-data/master/regression/linear_normal.csv"
 
-        df = pd.read_csv(data_url)
+        df = load_csv(data_url)
 
         # Animate the creation of Axes
         ax = Axes(x_range=[0, 100, 5], y_range=[-20, 200, 10])
@@ -36,8 +38,8 @@ class ScatterPlotAnimatedScene(Scene):
         self.wait()  # wait for 1 second
 
         # Animate the creation of dots
-        dots = [Dot(ax.c2p(x, y), color=BLUE) for x, y in df.values]
-        self.play(LaggedStart(*[Write(dot) for dot in dots], lag_ratio=.05))
+        dots = PointCloudPlot(ax, df.iloc[:, 0], df.iloc[:, 1], color=BLUE)
+        self.play(WritePoints(dots, lag_ratio=.05))
 
         self.wait()  # wait for 1 second
 
@@ -1,7 +1,15 @@
 from manim import *
-from scipy.stats import norm
 import os
 
+from threemds import tex_cache
+from threemds.distributions import normal
+from threemds.mobjects import FastNumberLabel, TrackedArea, TrackedLine, TrackedPlot
+from threemds.trackers import Derived
+from threemds.utils import render_sections
+
+# compile each distinct Tex string once, shared by every scene and run
+tex_cache.install()
+
 data = np.array([65.27153711, 61.69996242, 60.98565375, 65.30031155, 63.51806848, 68.19351011
                     , 66.95478689, 64.55759847, 63.39196506, 67.54289154, 63.19717054, 67.49928145
                     , 63.19766386, 72.39460819, 65.06618895, 61.47292356, 63.65363793, 67.40224834
@@ -32,7 +40,7 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
             def __init__(self, mean, std):
                 super().__init__()
 
-                f = lambda x: norm.pdf(x, mean, std)
+                f = normal(mean, std).pdf
 
                 self.mean = mean
                 self.std = std
@@ -61,14 +69,14 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
             def x2p(self, x):
                 return self.axes.c2p(x, self.f(x))
 
-            def area_range(self, x_start, x_end, color=BLUE):
-                return self.axes.get_area(self.plot, color=color, x_range=(x_start, x_end))
+            def area_range(self, x_range, color=BLUE, **kwargs):
+                return TrackedArea(self.axes, self.f, x_range, color=color, **kwargs)
 
         # Declare CDF model
         class CDFPlot(VGroup):
             def __init__(self, mean, std):
                 super().__init__()
-                f = lambda x: norm.cdf(x, mean, std)
+                f = normal(mean, std).cdf
 
                 axes = Axes(x_range=[mean - 3 * std, mean + 3 * std, std],
                             y_range=[0, 1.1, .25],
@@ -89,8 +97,8 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
             def x2p(self, x):
                 return self.axes.c2p(x, self.f(x))
 
-            def plot_to_x(self, x):
-                return self.axes.plot(self.f, color=RED, x_range=[mean - 3 * std, x])
+            def plot_to_x(self, x, **kwargs):
+                return TrackedPlot(self.axes, self.f, lambda: (mean - 3 * std, x()), color=RED, **kwargs)
 
             def vertical_line(self, x):
                 return DashedLine(
@@ -110,7 +118,7 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
         class PPFPlot(VGroup):
             def __init__(self, mean, std):
                 super().__init__()
-                f = lambda x: norm.ppf(x, mean, std)
+                f = normal(mean, std).ppf
 
                 axes = Axes(x_range=[.001, .999, .05],
                             y_range=[mean - 3 * std, mean + 3 * std, std],
@@ -179,25 +187,30 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
         # Declare the range for x values on PDF
         x_upper_tracker = ValueTracker(mean - std * 3)
 
+        # Values at x_upper shared by the updaters below, computed once per frame and only when x_upper moves
+        cdf_value = Derived(lambda: cdf_model.f(x_upper_tracker.get_value()), x_upper_tracker)
+        cdf_point = Derived(lambda: cdf_model.x2p(x_upper_tracker.get_value()), x_upper_tracker, cdf_model.axes)
+        on_pdf = (x_upper_tracker, pdf_model.axes)
+        on_cdf = (x_upper_tracker, cdf_model.axes)
+
         # Declare the area for the PDF which will update based on the trackers above
-        area_color = BLUE
-        area: Mobject = always_redraw(
-            lambda: pdf_model.area_range(-3 * std + mean, x_upper_tracker.get_value(), color=area_color)
-        )
+        area: Mobject = pdf_model.area_range(lambda: (-3 * std + mean, x_upper_tracker.get_value()),
+                                             depends_on=on_pdf)
 
         # Draw the connecting dashed line between the PDF and CDF projecting the area
-        connecting_line: DashedLine = always_redraw(lambda: DashedLine(
-            start=pdf_model.x2p(x_upper_tracker.get_value()),
-            end=cdf_model.x2p(x_upper_tracker.get_value()),
-            color=RED
-        ))
+        connecting_line: TrackedLine = TrackedLine(
+            start=lambda: pdf_model.x2p(x_upper_tracker.get_value()),
+            end=cdf_point.get_value,
+            dashed=True,
+            color=RED,
+            depends_on=on_pdf + on_cdf
+        )
 
         # Project the area to the CDF as x_upper increases, also show the area as a decimal
-        cdf_partial_plot = always_redraw(lambda: cdf_model.plot_to_x(x_upper_tracker.get_value()))
-        area_label = always_redraw(lambda: DecimalNumber(cdf_model.f(x_upper_tracker.get_value()), num_decimal_places=2) \
-                                   .scale(.8) \
-                                   .next_to(cdf_model.x2p(x_upper_tracker.get_value()), RIGHT)
-                                   )
+        cdf_partial_plot = cdf_model.plot_to_x(x_upper_tracker.get_value, depends_on=on_cdf)
+        area_label = FastNumberLabel(cdf_value.get_value(), num_decimal_places=2).scale(.8)
+        area_label.add_updater(lambda m: m.set_value(cdf_value.get_value()).next_to(cdf_point.get_value(), RIGHT),
+                               call_updater=True)
 
         # Populate the area plot, connecting line, partial CDF plot, area label
         self.play(*[FadeIn(mobj) for mobj in (area, connecting_line, cdf_partial_plot, area_label)])
@@ -257,7 +270,13 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
         self.wait()
 
         # draw the line to look up the area on CDF
-        cdf_horz_line: DashedLine = always_redraw(lambda: cdf_model.horizontal_line(x_upper_tracker.get_value()))
+        cdf_horz_line: TrackedLine = TrackedLine(
+            start=lambda: cdf_model.axes.c2p(-3 * std + mean, cdf_value.get_value()),
+            end=cdf_point.get_value,
+            dashed=True,
+            color=RED,
+            depends_on=on_cdf
+        )
         self.play(Write(cdf_horz_line))
         self.wait()
 
@@ -273,7 +292,7 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
 
         # get ready to break up the area into two pieces, from 65 to 70 and left tail to 65
         self.wait()
-        area_65_70 = always_redraw(lambda: pdf_model.area_range(x_upper_tracker.get_value(), 70, BLUE))
+        area_65_70 = pdf_model.area_range(lambda: (x_upper_tracker.get_value(), 70), BLUE, depends_on=on_pdf)
         self.add(area_65_70)
 
         # move the area up to 70 to the right side of the screen
@@ -288,7 +307,7 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
             .next_to(pdf_model.axes.c2p(65, 0), DOWN)
 
         # change area color to red, then look up area for x<=65
-        area_color = RED
+        area.set_color(RED)
         self.play(x_upper_tracker.animate.set_value(65),
                   FadeIn(label_x_eq_65)
                   )
@@ -409,13 +428,12 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
         self.wait()
 
         # Get .75 of area for PPF
-        area_color = BLUE
         x_upper_tracker.set_value(-3 * std + mean)
         x_area_75 = ppf_model.f(.75)
 
         # draw the .75 area
-        area_75: VMobject = always_redraw(
-            lambda: pdf_model.area_range(-3 * std + mean, x_upper_tracker.get_value(), color=BLUE))
+        area_75: VMobject = pdf_model.area_range(lambda: (-3 * std + mean, x_upper_tracker.get_value()), color=BLUE,
+                                                 depends_on=on_pdf)
         self.wait()
         self.add(area_75)
         self.play(x_upper_tracker.animate.set_value(x_area_75))
@@ -466,4 +484,4 @@ class PDFtoCDFtoPPFScene(MovingCameraScene):
 
 # Execute rendering
 if __name__ == "__main__":
-    os.system(r"manim -qk -v WARNING -p --disable_caching -o PDFtoCDFtoPPFScene.mp4 082220223_manim_normal_distribution_walkthrough.py.py PDFtoCDFtoPPFScene")
+    render_sections("PDFtoCDFtoPPFScene", q="k", verbosity="WARNING", disable_caching=True, preview=True)
@@ -1,6 +1,8 @@
 from manim import *
 import os
 
+from threemds.trackers import redraw
+
 class MyPlotScene(Scene):
     def construct(self):
 
@@ -25,17 +27,17 @@ class MyPlotSceneAnimated(Scene):
         ax = Axes(x_range=[-5, 5, 1], y_range=[-1, 5, 1])
 
         # declare the two functions but always update their upper end to the ValueTracker
-        f1 = always_redraw(lambda: ax.plot(lambda x: (1/5) * x ** 2, color=BLUE, x_range=[-5,vt.get_value()]))
-        f2 = always_redraw(lambda: ax.plot(lambda x: (1/2) * x + 1, color=YELLOW, x_range=[-5,vt.get_value()]))
+        f1 = redraw(lambda: ax.plot(lambda x: (1/5) * x ** 2, color=BLUE, x_range=[-5,vt.get_value()]))
+        f2 = redraw(lambda: ax.plot(lambda x: (1/2) * x + 1, color=YELLOW, x_range=[-5,vt.get_value()]))
 
         # declare two dots to trace the two functions, also pointed to the ValueTracker
-        f1_dot = always_redraw(lambda: Dot(
+        f1_dot = redraw(lambda: Dot(
                     point=ax.c2p(vt.get_value(), f1.underlying_function(vt.get_value())),
                     color=BLUE
                 )
             )
 
-        f2_dot = always_redraw(lambda: Dot(
+        f2_dot = redraw(lambda: Dot(
                     point=ax.c2p(vt.get_value(), f2.underlying_function(vt.get_value())),
                     color=YELLOW
                 )
@@ -1,5 +1,6 @@
 from manim import *
-from scipy.stats import norm
+from threemds.distributions import normal
+from threemds.mobjects import TrackedArea, TrackedLine, TrackedPlot
 import os
 
 class ProjectedAreaScene(Scene):
@@ -7,6 +8,7 @@ class ProjectedAreaScene(Scene):
 
         # declare mean and standard deviation
         mean, std = 0, 1
+        curve = normal(mean, std)
         x_lower, x_upper = mean-std*3, mean+std*3
 
         # declare ValueTracker to draw both graphs
@@ -30,32 +32,28 @@ class ProjectedAreaScene(Scene):
             .scale_to_fit_height(6)
 
         # declare PDF function plot and its area
-        pdf_partial_plot = always_redraw(lambda: pdf_ax.plot(lambda x: norm.pdf(x, mean, std),
-                                                  x_range=[x_lower, vt.get_value()],
-                                                  color=BLUE)
-                                 )
+        pdf_partial_plot = TrackedPlot(pdf_ax, curve.pdf,
+                                       x_range=lambda: (x_lower, vt.get_value()),
+                                       color=BLUE)
 
-        pdf_full_plot = pdf_ax.plot(lambda x: norm.pdf(x, mean, std))
+        pdf_full_plot = pdf_ax.plot(curve.pdf)
 
-        pdf_partial_area = always_redraw(lambda: pdf_ax.get_area(pdf_full_plot,
-                                                      color=BLUE,
-                                                      x_range=[x_lower, vt.get_value()])
-                                 )
+        pdf_partial_area = TrackedArea(pdf_ax, pdf_full_plot.underlying_function,
+                                       color=BLUE,
+                                       x_range=lambda: (x_lower, vt.get_value()))
 
 
-        cdf_partial_plot = always_redraw(lambda: cdf_ax.plot(lambda x: norm.cdf(x, mean, std),
-                                                  x_range=[x_lower, vt.get_value()],
-                                                  color=RED)
-                                 )
+        cdf_partial_plot = TrackedPlot(cdf_ax, curve.cdf,
+                                       x_range=lambda: (x_lower, vt.get_value()),
+                                       color=RED)
 
         # create the line that connects the PDF and CDF
-        projecting_line = always_redraw(lambda: DashedLine(color=YELLOW,
-                                                           start=pdf_ax.c2p(vt.get_value(), 0),
-                                                           end=cdf_ax.c2p(vt.get_value(),
-                                                                          norm.cdf(vt.get_value(), mean, std)
-                                                                          )
-                                                           )
-                                        )
+        projecting_line = TrackedLine(color=YELLOW,
+                                      start=lambda: pdf_ax.c2p(vt.get_value(), 0),
+                                      end=lambda: cdf_ax.c2p(vt.get_value(),
+                                                             curve.cdf(vt.get_value())
+                                                             ),
+                                      dashed=True)
 
         # add the axes and plots to the scene
         self.add(pdf_ax, cdf_ax, pdf_partial_area, cdf_partial_plot, projecting_line)
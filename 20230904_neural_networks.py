@@ -1,10 +1,17 @@
-import math
 import os
 
 from manim import *
 from manim.utils.color import hex_to_rgb
 import numpy as np
 
+from threemds import tex_cache
+from threemds.mobjects import point_from_proportion
+from threemds.networks import ForwardPassAnimator, NeuralNetworkDiagram, forward_pass
+from threemds.utils import render_sections
+
+# compile each distinct Tex string once, shared by every scene and run
+tex_cache.install()
+
 w_hidden = np.array([
     [3.55748018, 8.48639024, 1.59453643],
     [4.2898201,  8.35518251, 1.36713926],
@@ -34,10 +41,7 @@ relu = lambda x: np.maximum(x, 0)
 logistic = lambda x: 1 / (1 + np.exp(-x))
 
 # Runs inputs through the neural network to get predicted outputs
-Z1 = w_hidden @ X + b_hidden
-A1 = relu(Z1)
-Z2 = w_output @ A1 + b_output
-A2 = logistic(Z2)
+(Z1, Z2), (_, A1, A2) = forward_pass(X, [w_hidden, w_output], [b_hidden, b_output], [relu, logistic])
 
 print("Z1 =", Z1)
 print("A1 = ", A1)
@@ -80,58 +84,8 @@ class NNNode(VGroup):
 
 
 
-class NNConnection(VGroup):
-
-    def __init__(self, i: int, left_node: NNNode, right_node: NNNode, right_node_connect_angle: float):
-        super().__init__()
-
-        self.arrow = Arrow(
-            start=left_node.get_right(),
-            end= right_node.circle.point_at_angle(math.pi + right_node_connect_angle),
-            tip_length=0.2,
-            buff=.05
-        )
-        self.label = MathTex("w_{" + str(i + 1) + "}") \
-            .scale(.6) \
-            .next_to(self.arrow.get_midpoint(), UP*.5) \
-            .rotate(self.arrow.get_angle(), about_point=self.arrow.get_midpoint())
-
-        self.add(self.arrow, self.label)
-
 class NeuralNetworkScene(MovingCameraScene):
 
-    def connect_layers(self,
-                       layer: list[NNNode],
-                       next_layer: list[NNNode],
-                       start_index=0):
-
-        i = start_index
-        layer_grp = VDict()
-        layer_grp["groups"] = VGroup()
-        layer_grp["arrows"] = VGroup()
-        layer_grp["labels"] = VGroup()
-
-        for right_node in next_layer:
-            node_grp = VGroup()
-            for left_node in layer:
-                connect_angle = Line(left_node.get_center(), right_node.get_center()).get_angle()
-
-                nn_connection = NNConnection(i,
-                                             left_node,
-                                             right_node,
-                                             connect_angle
-                                             )
-
-                layer_grp["arrows"].add(nn_connection.arrow)
-                layer_grp["labels"].add(nn_connection.label)
-
-                node_grp.add(nn_connection)
-                i+=1
-
-            layer_grp["groups"].add(node_grp)
-
-        return layer_grp
-
     def construct(self):
         skip_flag = True
 
@@ -249,16 +203,13 @@ class NeuralNetworkScene(MovingCameraScene):
 
 
 
-        # CONNECT INPUT TO HIDDEN
-        input_to_hidden = self.connect_layers(
-            input_layer,
-            hidden_layer,
-            start_index=0
+        # CONNECT THE LAYERS, arrows and weight labels get built as they are used
+        network = NeuralNetworkDiagram(
+            [len(input_layer), len(hidden_layer), len(output_layer)],
+            weights=[w_hidden, w_output],
+            centers=[[node.circle.get_center() for node in layer] for layer in (input_layer, hidden_layer, output_layer)]
         )
 
-        # CONNECT HIDDEN TO OUTPUT
-        hidden_to_output = self.connect_layers(hidden_layer, output_layer, 9)
-
         # ==========================
         self.next_section("Fade out labels before making connections", skip_animations=False)
 
@@ -273,7 +224,7 @@ class NeuralNetworkScene(MovingCameraScene):
         self.next_section("Start cycling through weights and biases", skip_animations=skip_flag)
 
         # start cycling through weights on input-hidden
-        for i,grp in enumerate(input_to_hidden["groups"]):
+        for i,grp in enumerate(network.connections(0)):
             self.play(*[Write(mobj) for mobj in [grp,
                      hidden_layer[i].mathtex_lbl,
                      ]])
@@ -282,7 +233,7 @@ class NeuralNetworkScene(MovingCameraScene):
             self.wait(1)
 
         # start cycling through weights on hidden-output
-        for i,grp in enumerate(hidden_to_output["groups"]):
+        for i,grp in enumerate(network.connections(1)):
             self.play(*[Write(mobj) for mobj in [grp,
                      output_layer[i].mathtex_lbl,
                      ]])
@@ -351,8 +302,8 @@ class NeuralNetworkScene(MovingCameraScene):
 
         self.play(
             Restore(self.camera.frame),
-            FadeOut(hidden_to_output["labels"]),
-            FadeIn(input_to_hidden["arrows"])
+            FadeOut(network.labels(1)),
+            FadeIn(network.arrows(0))
         )
         self.wait()
 
@@ -520,14 +471,14 @@ class NeuralNetworkScene(MovingCameraScene):
         # and zoom in on the input and hidden layers
         self.play(
             Restore(self.camera.frame),
-            *[FadeOut(c) for c in input_to_hidden["arrows"]],
-            *[FadeOut(c) for c in hidden_to_output["arrows"]]
+            *[FadeOut(c) for c in network.arrows(0)],
+            *[FadeOut(c) for c in network.arrows(1)]
         )
         self.wait()
 
         # "skate" the values along the arrows
         for i in range(0,3):
-            i_arrows: list[Arrow] = [g.arrow for g in input_to_hidden["groups"][i]]
+            i_arrows: list[Arrow] = list(network.arrows(0, i))
             i_hidden_node: NNNode = hidden_layer[i]
 
             self.play(*[FadeIn(arrow) for arrow in i_arrows])
@@ -539,7 +490,7 @@ class NeuralNetworkScene(MovingCameraScene):
                              .add_background_rectangle(BLACK, opacity=.8)
                              .rotate(arrow.get_angle()) \
                              .add_updater(lambda mobj, arrow=arrow:
-                                 mobj.move_to(arrow.point_from_proportion(skate_alpha.get_value()))
+                                 mobj.move_to(point_from_proportion(arrow, skate_alpha.get_value()))
                              )
 
                          for arrow,input_node in zip(i_arrows, input_layer)
@@ -579,7 +530,7 @@ class NeuralNetworkScene(MovingCameraScene):
 
 
             # fade in weights on edges
-            w_labels =  VGroup(*[mobj.label.copy() for mobj in input_to_hidden["groups"][i]])
+            w_labels =  network.labels(0, i).copy()
 
             self.play(Write(w_labels))
             self.wait()
@@ -674,12 +625,12 @@ class NeuralNetworkScene(MovingCameraScene):
             self.wait()
 
         # restore all arrows in hidden layer
-        self.play(FadeIn(input_to_hidden["arrows"]))
+        self.play(FadeIn(network.arrows(0)))
         self.wait()
 
         # ========================================================================================
         self.next_section("Propagate output node, skate incoming values", skip_animations=skip_flag)
-        self.play(Write(hidden_to_output["arrows"]))
+        self.play(Write(network.arrows(1)))
         self.wait()
 
         hidden_solved = A1.flatten()
@@ -690,10 +641,10 @@ class NeuralNetworkScene(MovingCameraScene):
                              .add_background_rectangle(BLACK, opacity=.8)
                              .rotate(arrow.get_angle())
                              .add_updater(lambda mobj, arrow=arrow:
-                                 mobj.move_to(arrow.point_from_proportion(skate_alpha.get_value())),
+                                 mobj.move_to(point_from_proportion(arrow, skate_alpha.get_value())),
                                  call_updater=True
                              )
-            for v, arrow in zip(hidden_solved, hidden_to_output["arrows"])
+            for v, arrow in zip(hidden_solved, network.arrows(1))
         ])
 
         self.play(
@@ -708,7 +659,7 @@ class NeuralNetworkScene(MovingCameraScene):
         # zoom in on the output node
         self.camera.frame.save_state()
 
-        zoom_grp = VGroup(skating_labels, output_layer, sigmoid_label, sigmoid, hidden_to_output)
+        zoom_grp = VGroup(skating_labels, output_layer, sigmoid_label, sigmoid, network.connections(1))
         self.play(
             self.camera.frame.animate.move_to(zoom_grp) \
                 .set(width=zoom_grp.width * 1.1),
@@ -735,20 +686,20 @@ class NeuralNetworkScene(MovingCameraScene):
         self.wait()
 
         # make the weights appear
-        self.play(Write(hidden_to_output["labels"]))
+        self.play(Write(network.labels(1)))
         self.wait()
         output_weights = [MathTex(s, "=", round(v,2)) \
                               .scale(.45) \
                               .next_to(arrow.get_midpoint(), UP * .5) \
                               .rotate(arrow.get_angle(), about_point=arrow.get_midpoint())
 
-                          for v,s,arrow in zip(w_output[0],("w_{10}", "w_{11}", "w_{12}"), hidden_to_output["arrows"])
+                          for v,s,arrow in zip(w_output[0],("w_{10}", "w_{11}", "w_{12}"), network.arrows(1))
                           ]
 
         # slide the weight variables over to reveal their values
         self.play(
             *[TransformMatchingShapes(t1,t2)
-            for t1,t2 in zip(hidden_to_output["labels"], [ow[0] for ow in output_weights])
+            for t1,t2 in zip(network.labels(1), [ow[0] for ow in output_weights])
             ],
             *[FadeIn(ow[1:]) for ow in output_weights]
         )
@@ -843,6 +794,40 @@ class NeuralNetworkScene(MovingCameraScene):
         self.play(Write(dark_lbl))
         self.wait()
 
+class ForwardPassBatchScene(Scene):
+    def construct(self):
+        # a batch of random background colors, one per column like X
+        batch_rgb = np.random.default_rng(7).integers(0, 256, size=(3, 100))
+
+        network = NeuralNetworkDiagram([3, 3, 1],
+                                       weights=[w_hidden, w_output],
+                                       weight_colors=(BLUE, RED),
+                                       weight_widths=(1, 8)).scale_to_fit_height(6).shift(RIGHT)
+
+        animator = ForwardPassAnimator(network, batch_rgb / 255,
+                                       [w_hidden, w_output], [b_hidden, b_output], [relu, logistic])
+
+        # the input color, with the font color the network picks for it
+        color_box = Rectangle(width=2, height=1.5, fill_opacity=1).to_edge(LEFT)
+        light_label = Text("LIGHT", color=WHITE).scale(.6).move_to(color_box)
+        dark_label = Text("DARK", color=BLACK).scale(.6).move_to(color_box)
+
+        def show_color(k):
+            rgb = batch_rgb[:, k] / 255
+            color_box.set_fill(rgb_to_color(rgb)).set_stroke(rgb_to_color(rgb))
+            is_dark = animator.outputs[-1][0, k] >= .5
+            light_label.set_opacity(0 if is_dark else 1)
+            dark_label.set_opacity(1 if is_dark else 0)
+
+        show_color(0)
+        animator.set_sample(0)
+        self.play(Write(network), FadeIn(color_box, light_label, dark_label), Write(animator.labels))
+        self.wait()
+
+        for k in range(animator.batch_size):
+            show_color(k)
+            self.play(animator.animate_sample(k), run_time=1)
+
 # Execute rendering
 if __name__ == "__main__":
-    os.system( r"manim -qk -v WARNING -p --disable_caching -o NeuralNetworkScene.mp4 20230904_neural_networks.py NeuralNetworkScene")
+    render_sections("NeuralNetworkScene", q="k", verbosity="WARNING", disable_caching=True, preview=True)
@@ -1,7 +1,11 @@
 
 from manim import *
+from threemds import tex_cache
 from threemds.utils import render_scenes
 
+# compile each distinct Tex string once, shared by every scene and run
+tex_cache.install()
+
 class BayesTheorem(Scene):
     def construct(self):
         title = Tex("Bayes Theorem", color=BLUE).scale(1.3).to_edge(UL)
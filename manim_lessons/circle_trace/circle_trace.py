@@ -1,5 +1,12 @@
 from manim import *
 import os
+import pathlib
+import sys
+
+# the shared threemds package lives at the root of the repo
+sys.path.append(str(pathlib.Path(__file__).parents[2].resolve()))
+from threemds.mobjects import point_from_proportion
+from threemds.utils import render_scenes
 
 config.quality = "fourk_quality"
 config.preview = True
@@ -14,8 +21,8 @@ class CircleTraceProportion(Scene):
         point = Dot()
         vt = DecimalNumber(0.0)
 
-        point.add_updater(lambda m: m.move_to(circle.point_from_proportion(vt.get_value())), call_updater=True)
-        vt.add_updater(lambda m: m.move_to(circle.point_from_proportion(vt.get_value()) * 1.3), call_updater=True)
+        point.add_updater(lambda m: m.move_to(point_from_proportion(circle, vt.get_value())), call_updater=True)
+        vt.add_updater(lambda m: m.move_to(point_from_proportion(circle, vt.get_value()) * 1.3), call_updater=True)
 
         self.add(vt, point)
         self.wait()
@@ -64,6 +71,4 @@ class CircleTraceRadians(Scene):
 
 
 if __name__ == "__main__":
-    os.system(r"manim circle_trace.py CircleTraceProportion")
-    os.system(r"manim circle_trace.py CircleTraceDegrees")
-    os.system(r"manim circle_trace.py CircleTraceRadians")
\ No newline at end of file
+    render_scenes(scene_names=["CircleTraceProportion", "CircleTraceDegrees", "CircleTraceRadians"])
\ No newline at end of file
@@ -2,6 +2,13 @@ from manim import *
 import numpy as np
 import os
 import pathlib
+import sys
+
+# the shared threemds package lives at the root of the repo
+sys.path.append(str(pathlib.Path(__file__).parents[2].resolve()))
+from threemds import scenes, store
+from threemds.trackers import redraw
+from threemds.utils import render_scenes
 
 config.quality = "fourk_quality"
 config.preview = True
@@ -9,86 +16,10 @@ config.verbosity = "WARNING"
 config.disable_caching = False
 
 resources_folder = os.path.join(pathlib.Path(__file__).parent.resolve(), "resource")
-def get_resource(filename: str): return os.path.join(resources_folder, filename)
-
-class LogoScene(Scene):
-
-    def construct(self):
-        circle = Circle(1.0, color=BLUE)
-        rectangle = Rectangle(height=1.0, width=2.0, color=BLUE).move_to(circle, UP)
-
-        handle = RoundedRectangle(corner_radius=.5, height=1.5, width=2.0, color=BLUE) \
-            .move_to(circle).shift(LEFT * .8)
-
-        handle_inner = Difference(handle, handle.copy().scale(.8), color=BLUE, fill_opacity=0.0)
-
-        cup = VGroup(circle, rectangle, handle_inner)
-
-        self.play(
-            Create(cup)
-        )
-
-        self.play(
-            cup.animate.set_fill(BLUE, opacity=1)
-        )
-
-        # create sin wave steam
-
-        def get_sine_wave(dx=0):
-            return FunctionGraph(
-                lambda x: np.sin((x + dx)),
-                x_range=[-3, 3]
-            )
-
-        sine_function = get_sine_wave()
-        d_theta = ValueTracker(0)
-
-        def update_wave(func):
-            func.become(
-                get_sine_wave(dx=d_theta.get_value())
-            )
-            return func
-
-        sine_function.add_updater(update_wave)
+def get_resource(filename: str): return store.resolve(os.path.join(resources_folder, filename))
 
-        self.play(Create(sine_function))
-        self.play(d_theta.animate.increment_value(4 * PI), run_time=2)
-
-        # create steam functions
-        steam_functions = []
-        steam_waves = VGroup()
-        for i in range(3):
-            steam_function = get_sine_wave() \
-                .rotate(PI / 2.0) \
-                .scale(.2) \
-                .next_to(cup, UP) \
-                .shift([i * .5, 0, 0])
-
-            steam_waves.add(steam_function)
-
-            d_theta = ValueTracker(0)
-
-            def update_wave(func, d=d_theta, i=i):
-                func.become(
-                    get_sine_wave(dx=d.get_value()) \
-                        .rotate(PI / 2.0) \
-                        .scale(.2) \
-                        .next_to(cup, UP) \
-                        .shift([i * .5, 0, 0])
-                )
-                return func
-
-            steam_function.add_updater(update_wave)
-
-            steam_functions += d_theta
-
-            self.play(Create(steam_function), run_time=.3)
-
-        text = Text("3-Minute Data Science").scale(.8).shift(DOWN * 1.5)
-        self.play(Write(text), run_time=.5)
-        #mobj_to_svg(VGroup(cup, steam_waves, sine_function), 'logo.svg', h_padding=1)
-        self.play(*(d.animate.increment_value(4 * PI) for d in steam_functions), run_time=8, rate_func=linear)
-        self.wait()
+class LogoScene(scenes.LogoScene):
+    pass
 
 
 class PieChart(Scene):
@@ -126,12 +57,12 @@ class PieChartAnimated(Scene):
         rotate_angles = np.cumsum([0, .3, .15, .10, .05])
         colors = [RED, BLUE, PURPLE, GREEN, ORANGE]
 
-        sectors = [always_redraw(lambda _w=w, _c=c, _r=r:
-                                 Sector(outer_radius=3,
-                                        color=_c,
-                                        angle=pie_vt.get_value() * DEGREES * _w) \
-                                 .rotate(-_r * pie_vt.get_value() * DEGREES, about_point=ORIGIN)
-                                 )
+        sectors = [redraw(lambda _w=w, _c=c, _r=r:
+                          Sector(outer_radius=3,
+                                 color=_c,
+                                 angle=pie_vt.get_value() * DEGREES * _w) \
+                          .rotate(-_r * pie_vt.get_value() * DEGREES, about_point=ORIGIN)
+                          )
                    for w, c, r in zip(weights, colors, rotate_angles)]
 
         self.add(*sectors)
@@ -161,28 +92,10 @@ class JetBrainsPromo(Scene):
         )
 
 
-class ClosingCard(Scene):
-  def construct(self):
-
-    title = Text("Get 10-Day Free Access") \
-        .set_color(BLUE).to_edge(UL)
-
-    books = Group(
-      ImageMobject(get_resource("book1.jpg")),
-      ImageMobject(get_resource("book2.jpg"))
-    ).scale(.33).arrange(RIGHT,buff=.8).next_to(title,DOWN,buff=.8,aligned_edge=LEFT)
-
-    source_code = Tex("My books, live trainings, courses and more!", color=BLUE) \
-        .next_to(books, DOWN, aligned_edge=LEFT,buff=1)
-
-    email = Text(r"See link in the description") \
-        .scale(.5) \
-        .next_to(source_code, DOWN, aligned_edge=LEFT)
-
-    self.play(*[FadeIn(mobj) for mobj in (title, books, source_code, email)])
-
-    self.wait(29)
+class ClosingCard(scenes.ClosingCard):
+    book_files = (get_resource("book1.jpg"), get_resource("book2.jpg"))
+    book_scale = .33
 
 
 if __name__ == "__main__":
-    os.system(r"manim pie_charts.py ClosingCard")
+    render_scenes(scene_names=["ClosingCard"])
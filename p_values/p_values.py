@@ -1,8 +1,19 @@
 import pathlib
+import sys
 from manim import *
-from scipy.stats import norm
 import os
 
+# the shared threemds package lives at the root of the repo
+sys.path.append(str(pathlib.Path(__file__).parent.parent.resolve()))
+from threemds import scenes, store, tex_cache
+from threemds.assets import load_svg
+from threemds.distributions import normal
+from threemds.mobjects import FastNumberLabel, TrackedArea, TrackedLine
+from threemds.utils import render_scenes
+
+# compile each distinct Tex string once, shared by every scene and run
+tex_cache.install()
+
 config.quality = "fourk_quality"
 config.preview = True
 config.verbosity = "WARNING"
@@ -11,15 +22,15 @@ config.disable_caching = False
 # where graphics are stored
 resources_folder = os.path.join(pathlib.Path(__file__).parent.resolve(), "resources")
 
-def get_svg(filename: str): return os.path.join(resources_folder, filename)
+def get_svg(filename: str): return store.resolve(os.path.join(resources_folder, filename))
 
-class Teacup(SVGMobject):
+class Teacup(VGroup):
     def __init__(self, fill_color: str) -> None:
-        super().__init__(file_name=get_svg("hot-tea-icon.svg"), fill_color=fill_color)
+        super().__init__(*load_svg(get_svg("hot-tea-icon.svg"), fill_color=fill_color))
 
-class Teakettle(SVGMobject):
+class Teakettle(VGroup):
     def __init__(self, fill_color: str) -> None:
-        super().__init__(file_name=get_svg("coffee-tea-kettle-icon.svg"), fill_color=fill_color)
+        super().__init__(*load_svg(get_svg("coffee-tea-kettle-icon.svg"), fill_color=fill_color))
 
 class TitleScene(Scene):
 
@@ -151,9 +162,9 @@ class TeacupScene(Scene):
         self.play(Indicate(h_group[2:4]))
         self.wait()
 
-class Pill(SVGMobject):
+class Pill(VGroup):
     def __init__(self) -> None:
-        super().__init__(file_name=get_svg("pill.svg"))
+        super().__init__(*load_svg(get_svg("pill.svg")))
 
 
 class ColdTestScene(MovingCameraScene):
@@ -161,7 +172,8 @@ class ColdTestScene(MovingCameraScene):
         # declare normal distribution
         mean = 18
         std = 1.5
-        f = lambda x: norm.pdf(x, mean, std)
+        curve = normal(mean, std)
+        f = curve.pdf
 
         # declare axis
         ax = Axes(x_range=[mean-4*std, mean+4*std, std],
@@ -187,15 +199,21 @@ class ColdTestScene(MovingCameraScene):
         z_tracker = ValueTracker(.001)
 
         # shade area
-        def area_for_z(z: float): return 1 - 2*norm.cdf(-z)
-        area = always_redraw(lambda: ax.get_area(plt,x_range=(mean-z_tracker.get_value()*std, mean+z_tracker.get_value()*std)))
+        def area_for_z(z: float): return 1 - 2*normal().cdf(-z)
+        area = TrackedArea(ax, f, lambda: (mean-z_tracker.get_value()*std, mean+z_tracker.get_value()*std))
         self.add(area)
 
         self.play(z_tracker.animate.set_value(4))
         self.wait()
-        a_txt = always_redraw(lambda: MathTex("A =", round(area_for_z(z_tracker.get_value()), 2))
-                              .move_to(plt.get_center())
-                              )
+        a_txt = VGroup(MathTex("A ="), FastNumberLabel(area_for_z(z_tracker.get_value())))
+
+        def update_a_txt(m):
+            m[1].set_value(area_for_z(z_tracker.get_value()))
+            # digits sit on the baseline of "A =" as they did in one MathTex
+            m[1].next_to(m[0], RIGHT, buff=SMALL_BUFF, aligned_edge=DOWN)
+            m.move_to(plt.get_center())
+
+        a_txt.add_updater(update_a_txt, call_updater=True)
         self.play(Write(a_txt))
         self.wait()
 
@@ -213,9 +231,9 @@ class ColdTestScene(MovingCameraScene):
 
         # draw dashed line and pill
         pill_x_vt = ValueTracker(16)
-        line = always_redraw(lambda:
-                             DashedLine(start=ax.c2p(pill_x_vt.get_value(),0), end=ax.c2p(pill_x_vt.get_value(), f(pill_x_vt.get_value())))
-                             )
+        line = TrackedLine(start=lambda: ax.c2p(pill_x_vt.get_value(),0),
+                           end=lambda: ax.c2p(pill_x_vt.get_value(), f(pill_x_vt.get_value())),
+                           dashed=True)
 
         pill = Pill().rotate(45*DEGREES).scale(.5)
         pill.add_updater(lambda mobj: mobj.next_to(line, UL))
@@ -264,15 +282,13 @@ class ColdTestScene(MovingCameraScene):
         lower_vt = ValueTracker(pill_x_vt.get_value())
         upper_vt = ValueTracker(pill_x_vt.get_value())
 
-        left_tail = always_redraw(lambda:
-                                  ax.get_area(plt, x_range=(lower_vt.get_value(), upper_vt.get_value()), color=RED)
-                                  )
+        left_tail = TrackedArea(ax, f, lambda: (lower_vt.get_value(), upper_vt.get_value()), color=RED)
         self.add(left_tail)
         self.play(lower_vt.animate.set_value(mean-4*std), run_time=3)
         self.wait()
 
         # show area
-        tail_label = MathTex(round(norm.cdf(pill_x_vt.get_value(),loc=mean, scale=std), 4)) \
+        tail_label = MathTex(round(curve.cdf(pill_x_vt.get_value()), 4)) \
                                         .move_to(plt.get_center())
 
 
@@ -292,7 +308,7 @@ class ColdTestScene(MovingCameraScene):
 
         # label p-value areas
         self.play(Rotate(left_tail_line.copy(), angle=-180*DEGREES, axis=Y_AXIS, about_point=ORIGIN),
-                  tail_label.animate.become(MathTex(round(norm.cdf(pill_x_vt.get_value(),loc=mean, scale=std)*2, 4)) \
+                  tail_label.animate.become(MathTex(round(curve.cdf(pill_x_vt.get_value())*2, 4)) \
                                         .move_to(plt.get_center())),
                   run_time=2)
         self.wait()
@@ -311,113 +327,15 @@ class ColdTestScene(MovingCameraScene):
         self.wait()
 
 
-class ClosingCard(Scene):
-  def construct(self):
-
-    title = Text("Get 10-Day Free Access") \
-        .set_color(BLUE).to_edge(UL)
-
-    books = Group(
-      ImageMobject(r"resources/book1.jpg"),
-      ImageMobject(r"resources/book2.jpg")
-    ).scale(.9).arrange(RIGHT,buff=.8).next_to(title,DOWN,buff=.8,aligned_edge=LEFT)
-
-    source_code = Tex("My books, live trainings, courses and more!", color=BLUE) \
-        .next_to(books, DOWN, aligned_edge=LEFT,buff=1)
-
-    email = Text(r"See link in the description") \
-        .scale(.5) \
-        .next_to(source_code, DOWN, aligned_edge=LEFT)
-
-    self.play(*[FadeIn(mobj) for mobj in (title, books, source_code, email)])
-
-    self.wait(29)
+class ClosingCard(scenes.ClosingCard):
+    book_files = (get_svg("book1.jpg"), get_svg("book2.jpg"))
 
-class LogoScene(Scene):
 
-    def construct(self):
-        circle = Circle(1.0, color=BLUE)
-        rectangle = Rectangle(height=1.0, width=2.0, color=BLUE).move_to(circle, UP)
-
-        handle = RoundedRectangle(corner_radius=.5, height=1.5, width=2.0, color=BLUE) \
-            .move_to(circle).shift(LEFT * .8)
-
-        handle_inner = Difference(handle, handle.copy().scale(.8), color=BLUE, fill_opacity=0.0)
-
-        cup = VGroup(circle, rectangle, handle_inner)
-
-        self.play(
-            Create(cup)
-        )
-
-        self.play(
-            cup.animate.set_fill(BLUE, opacity=1)
-        )
-
-        # create sin wave steam
-
-        def get_sine_wave(dx=0):
-            return FunctionGraph(
-                lambda x: np.sin((x + dx)),
-                x_range=[-3, 3]
-            )
-
-        sine_function = get_sine_wave()
-        d_theta = ValueTracker(0)
-
-        def update_wave(func):
-            func.become(
-                get_sine_wave(dx=d_theta.get_value())
-            )
-            return func
-
-        sine_function.add_updater(update_wave)
-
-        self.play(Create(sine_function))
-        self.play(d_theta.animate.increment_value(4 * PI), run_time=2)
-
-        # create steam functions
-        steam_functions = []
-        steam_waves = VGroup()
-        for i in range(3):
-            steam_function = get_sine_wave() \
-                .rotate(PI / 2.0) \
-                .scale(.2) \
-                .next_to(cup, UP) \
-                .shift([i * .5, 0, 0])
-
-            steam_waves.add(steam_function)
-
-            d_theta = ValueTracker(0)
-
-            def update_wave(func, d=d_theta, i=i):
-                func.become(
-                    get_sine_wave(dx=d.get_value()) \
-                        .rotate(PI / 2.0) \
-                        .scale(.2) \
-                        .next_to(cup, UP) \
-                        .shift([i * .5, 0, 0])
-                )
-                return func
-
-            steam_function.add_updater(update_wave)
-
-            steam_functions += d_theta
-
-            self.play(Create(steam_function), run_time=.3)
-
-        text = Text("3-Minute Data Science").scale(.8).shift(DOWN * 1.5)
-        self.play(Write(text), run_time=.5)
-        #mobj_to_svg(VGroup(cup, steam_waves, sine_function), 'logo.svg', h_padding=1)
-        self.play(*(d.animate.increment_value(4 * PI) for d in steam_functions), run_time=8, rate_func=linear)
-        self.wait()
+class LogoScene(scenes.LogoScene):
+    pass
 
 
 # Execute rendering
 if __name__ == "__main__":
-    os.system(r"manim p_values.py TitleScene")
-    os.system(r"manim p_values.py TeacupScene")
-    os.system(r"manim p_values.py ColdTestScene")
-    os.system(r"manim p_values.py LogoScene")
-    os.system(r"manim p_values.py ClosingCard")
+    render_scenes(scene_names=["TitleScene", "TeacupScene", "ColdTestScene", "LogoScene", "ClosingCard"])
 
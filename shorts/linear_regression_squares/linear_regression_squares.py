@@ -1,8 +1,14 @@
 from manim import *
 import os
+import pathlib
+import sys
 import numpy as np
 from sklearn.linear_model import LinearRegression
 
+# the shared threemds package lives at the root of the repo
+sys.path.append(str(pathlib.Path(__file__).parents[2].resolve()))
+from threemds.mobjects import PointCloudPlot
+
 config.preview = True
 config.verbosity = "WARNING"
 config.disable_caching = False
@@ -24,7 +30,7 @@ class LinearRegressionSquares(Scene):
         y = np.array([1.52246106, 6.2760993, 3.80538691, 6.19722876,
                       7.21630459, 11.43284789, 11.8475795, 10.04278697, 16.15779999])
 
-        points = VGroup(*[Dot(ax.c2p(_x,_y), color=BLUE) for _x,_y in zip(x,y)])
+        points = PointCloudPlot(ax, x, y, color=BLUE)
         print(y)
 
         fit = LinearRegression().fit(x.reshape(-1, 1), y)
@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# the shared threemds package lives at the root of the repo
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1].resolve()))
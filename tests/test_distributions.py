@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+stats = pytest.importorskip("scipy.stats")
+
+from threemds.distributions import DistributionCurve, normal
+
+
+@pytest.mark.parametrize("mean, std", [(0.0, 1.0), (2.5, 0.4), (-10.0, 3.0)])
+def test_matches_scipy(mean, std):
+    curve = DistributionCurve(mean, std)
+    xs = np.linspace(mean - 6 * std, mean + 6 * std, 1001)
+    np.testing.assert_allclose(curve.pdf(xs), stats.norm.pdf(xs, mean, std), atol=1e-5 / std)
+    np.testing.assert_allclose(curve.cdf(xs), stats.norm.cdf(xs, mean, std), atol=1e-6)
+
+    ps = np.linspace(.001, .999, 999)
+    np.testing.assert_allclose(curve.ppf(ps), stats.norm.ppf(ps, mean, std), atol=1e-3 * std)
+    assert curve.area(mean - std, mean + std) == pytest.approx(stats.norm.cdf(1) - stats.norm.cdf(-1), abs=1e-6)
+
+
+def test_outside_the_table():
+    curve = DistributionCurve()
+    assert curve.pdf(100.0) == 0.0
+    assert curve.cdf(-100.0) == 0.0
+    assert curve.cdf(100.0) == 1.0
+
+
+def test_scalars_stay_scalars():
+    curve = DistributionCurve()
+    assert np.ndim(curve.pdf(0.0)) == 0
+    assert isinstance(curve.ppf(.5), float)
+    assert curve.ppf(.5) == pytest.approx(0.0, abs=1e-9)
+
+
+def test_normal_is_shared():
+    assert normal(1.0, 2.0) is normal(1.0, 2.0)
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from threemds import kdenlive
+
+# saved on another machine, where the repo was /Users/someone/git/3mds
+PROJECT = """<?xml version='1.0' encoding='utf-8'?>
+<mlt LC_NUMERIC="C" producer="main_bin" root="/Users/someone/git/3mds/episode/kdenlive" version="7.4.0">
+ <producer id="producer0">
+  <property name="resource">voice.m4a</property>
+ </producer>
+ <producer id="producer1">
+  <property name="resource">/Users/someone/git/3mds/episode/media/videos/episode/1080p60/Intro.mp4</property>
+  <property name="kdenlive:proxy">proxies/Intro.mkv</property>
+  <property name="kdenlive:originalurl">/Users/someone/git/3mds/episode/media/videos/episode/1080p60/Intro.mp4</property>
+ </producer>
+ <producer id="producer2">
+  <property name="resource">0.5:slow.mp4</property>
+  <property name="warp_resource">slow.mp4</property>
+ </producer>
+ <playlist id="main_bin">
+  <property name="kdenlive:docproperties.renderurl">final.mp4</property>
+ </playlist>
+</mlt>
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    project_dir = tmp_path / "3mds" / "episode" / "kdenlive"
+    project_dir.mkdir(parents=True)
+    (project_dir / "episode.kdenlive").write_text(PROJECT)
+    for f in ("voice.m4a", "slow.mp4", "old_take.m4a", "final.mp4", "thumbnail.png"):
+        (project_dir / f).write_bytes(b"media")
+    return tmp_path / "3mds"
+
+
+def test_referenced_files(repo):
+    episode = (repo / "episode").resolve()
+    assert kdenlive.referenced_files(repo / "episode" / "kdenlive" / "episode.kdenlive") == {
+        episode / "kdenlive" / "voice.m4a",
+        episode / "media" / "videos" / "episode" / "1080p60" / "Intro.mp4",
+        episode / "kdenlive" / "proxies" / "Intro.mkv",
+        episode / "kdenlive" / "slow.mp4",
+    }
+
+
+def test_cleanup_leaves_exports_and_artwork(repo):
+    project_dir = repo / "episode" / "kdenlive"
+    assert [Path(f).name for f in kdenlive.cleanup(repo)] == ["old_take.m4a"]
+
+    kdenlive.cleanup(repo, trash=True)
+    assert (repo / "episode" / "trash" / "old_take.m4a").exists()
+    assert {f.name for f in project_dir.iterdir()} == {"episode.kdenlive", "voice.m4a", "slow.mp4", "final.mp4",
+                                                        "thumbnail.png"}
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+
+from threemds.mobjects import ArcLengthTable, point_from_proportion
+
+
+@pytest.fixture(params=["circle", "smooth", "with_straight_segments"])
+def vmobject(request):
+    if request.param == "circle":
+        return manim.Circle(radius=2).shift(manim.LEFT)
+    if request.param == "smooth":
+        return manim.VMobject().set_points_smoothly([[-3, 0, 0], [-1, 2, 0], [0, -1, 0], [2, 1, 0], [3, 0, 0]])
+    return manim.VMobject().set_points_as_corners([[0, 0, 0], [1, 0, 0], [1, 1, 0], [1, 1, 0], [3, 2, 0]])
+
+
+def test_matches_manim(vmobject):
+    table = ArcLengthTable(vmobject)
+    alphas = np.linspace(0, 1, 101)
+    expected = np.array([vmobject.point_from_proportion(a) for a in alphas])
+    np.testing.assert_allclose(table.point_from_proportion(alphas), expected, atol=1e-9)
+    np.testing.assert_allclose(table.point_from_proportion(.37), vmobject.point_from_proportion(.37), atol=1e-9)
+
+
+def test_follows_changed_points(vmobject):
+    point_from_proportion(vmobject, .5)
+    vmobject.shift(manim.UP)
+    np.testing.assert_allclose(point_from_proportion(vmobject, .5), vmobject.point_from_proportion(.5), atol=1e-9)
+
+
+def test_alpha_out_of_range(vmobject):
+    with pytest.raises(ValueError):
+        ArcLengthTable(vmobject).point_from_proportion(1.5)
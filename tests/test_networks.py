@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+from threemds.networks import forward_pass
+
+
+def relu(z):
+    return np.maximum(z, 0)
+
+
+def sigmoid(z):
+    return 1 / (1 + np.exp(-z))
+
+
+def test_batch_matches_one_input_at_a_time():
+    rng = np.random.default_rng(7)
+    sizes = [3, 4, 2]
+    weights = [rng.normal(size=(n_out, n_in)) for n_in, n_out in zip(sizes, sizes[1:])]
+    biases = [rng.normal(size=(n_out, 1)) for n_out in sizes[1:]]
+    X = rng.normal(size=(3, 5))
+
+    zs, outputs = forward_pass(X, weights, biases, [relu, sigmoid])
+    assert [z.shape for z in zs] == [(4, 5), (2, 5)]
+    assert [o.shape for o in outputs] == [(3, 5), (4, 5), (2, 5)]
+
+    for column in range(X.shape[1]):
+        a = X[:, [column]]
+        for w, b, activation, z, output in zip(weights, biases, [relu, sigmoid], zs, outputs[1:]):
+            expected_z = w @ a + b
+            a = activation(expected_z)
+            np.testing.assert_allclose(z[:, [column]], expected_z)
+            np.testing.assert_allclose(output[:, [column]], a)
+
+
+def test_input_is_the_first_output():
+    X = [[1.0, 2.0]]
+    zs, outputs = forward_pass(X, [np.array([[2.0]])], [np.array([[1.0]])], [relu])
+    np.testing.assert_array_equal(outputs[0], np.array(X))
+    np.testing.assert_array_equal(outputs[1], [[3.0, 5.0]])
@@ -0,0 +1,63 @@
+import hashlib
+import os
+
+import pytest
+
+from threemds import store
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "STORE_DIR", tmp_path / "store")
+    monkeypatch.setattr(store, "INDEX_FILE", tmp_path / "store" / "index.json")
+    monkeypatch.setattr(store, "_index", None)
+    return tmp_path / "store"
+
+
+def test_digest_is_sha256(tmp_path):
+    f = tmp_path / "a.png"
+    f.write_bytes(b"pixels")
+    assert store.digest(f) == hashlib.sha256(b"pixels").hexdigest()
+
+
+def test_digest_rereads_only_changed_files(tmp_path):
+    f = tmp_path / "a.png"
+    f.write_bytes(b"pixels")
+    first = store.digest(f)
+    stat = f.stat()
+
+    # same size and mtime: the indexed digest is trusted without reading the file
+    f.write_bytes(b"PIXELS")
+    os.utime(f, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert store.digest(f) == first
+
+    os.utime(f, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert store.digest(f) == hashlib.sha256(b"PIXELS").hexdigest()
+
+
+def test_resolve_gives_copies_one_path(tmp_path):
+    a, b, other = tmp_path / "ep1" / "book.jpg", tmp_path / "ep2" / "book.jpg", tmp_path / "ep2" / "logo.jpg"
+    for f, data in ((a, b"book"), (b, b"book"), (other, b"logo")):
+        f.parent.mkdir(exist_ok=True)
+        f.write_bytes(data)
+
+    assert store.resolve(a) == store.resolve(b)
+    assert store.resolve(a) != store.resolve(other)
+    with open(store.resolve(b), "rb") as fp:
+        assert fp.read() == b"book"
+
+
+def test_resolve_survives_a_new_process(tmp_path, monkeypatch):
+    a, b = tmp_path / "a.jpg", tmp_path / "b.jpg"
+    a.write_bytes(b"book")
+    b.write_bytes(b"book")
+    resolved = store.resolve(a)
+
+    # a later render worker starts from the saved index
+    monkeypatch.setattr(store, "_index", None)
+    assert store.resolve(b) == resolved
+
+
+def test_resolve_leaves_missing_files_alone(tmp_path):
+    missing = tmp_path / "missing.jpg"
+    assert store.resolve(missing) == str(missing)
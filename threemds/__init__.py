@@ -0,0 +1 @@
+"""Shared helpers for the 3-Minute Data Science manim scripts."""
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from manim import SVGMobject, VGroup, VMobject
+
+# parsed SVGs keep across runs in here, set THREEMDS_SVG_DISK_CACHE=0 to parse every cold start
+SVG_CACHE_DIR = Path(os.environ.get("THREEMDS_CACHE_DIR", Path.home() / ".cache" / "threemds")) / "svg"
+DISK_CACHE = os.environ.get("THREEMDS_SVG_DISK_CACHE", "1") not in ("", "0")
+
+# parsed SVGs of this process, keyed by (path, mtime, style overrides)
+_svgs = {}
+
+
+def _cache_file(key: tuple) -> Path:
+    import manim
+    digest = hashlib.sha256(json.dumps([*key, manim.__version__], default=str).encode()).hexdigest()
+    return SVG_CACHE_DIR / f"{digest}.npz"
+
+
+def _save(svg: VGroup, path: Path) -> None:
+    arrays = {}
+    for i, m in enumerate(svg):
+        arrays[f"points_{i}"] = m.points
+        arrays[f"fill_{i}"] = m.fill_rgbas
+        arrays[f"stroke_{i}"] = m.stroke_rgbas
+        arrays[f"stroke_width_{i}"] = np.asarray(m.stroke_width)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # write next to the target and rename, render workers may cache the same file at once
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as fp:
+        np.savez(fp, **arrays)
+    os.replace(tmp, path)
+
+
+def _load(path: Path) -> VGroup:
+    svg = VGroup()
+    with np.load(path) as arrays:
+        for i in range(len(arrays.files) // 4):
+            m = VMobject(stroke_width=float(arrays[f"stroke_width_{i}"]))
+            m.set_points(arrays[f"points_{i}"])
+            m.fill_rgbas = arrays[f"fill_{i}"]
+            m.stroke_rgbas = arrays[f"stroke_{i}"]
+            svg.add(m)
+    return svg
+
+
+def load_svg(file_name: str, **style) -> VGroup:
+    """``SVGMobject(file_name, **style)`` as a group of plain VMobjects, parsed once per process.
+
+    The parsed paths and their styles are kept per (path, mtime, style overrides), so
+    every call after the first only copies point arrays, and editing the file picks up
+    the change. They are also stored as npz under SVG_CACHE_DIR for cold starts.
+    """
+    path = Path(file_name).resolve()
+    key = (str(path), path.stat().st_mtime_ns, tuple(sorted((k, repr(v)) for k, v in style.items())))
+
+    if key not in _svgs:
+        cache_file = _cache_file(key)
+        if DISK_CACHE and cache_file.exists():
+            _svgs[key] = _load(cache_file)
+        else:
+            parsed = SVGMobject(file_name=str(path), **style)
+            _svgs[key] = VGroup(*[m.copy() for m in parsed.family_members_with_points()])
+            if DISK_CACHE:
+                _save(_svgs[key], cache_file)
+    return _svgs[key].copy()
@@ -0,0 +1,240 @@
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from threemds.utils import QUALITIES, REPO_ROOT, load_script, scene_config
+
+BENCH_DIR = REPO_ROOT / "bench"
+HISTORY_FILE = BENCH_DIR / "history.json"
+# local CSVs named like the files of the URLs the scripts load, so benchmarks run offline
+DATASETS_DIR = BENCH_DIR / "datasets"
+
+# what gets compared against the baseline, and whether larger is worse
+METRICS = {"render_seconds": True, "construct_seconds": True, "fps": False, "peak_rss_mb": True, "output_mb": True}
+# the metrics that fail a run when they regress beyond the threshold
+GATED = ("render_seconds", "fps", "peak_rss_mb")
+
+
+def _scene_bases() -> set[str]:
+    source = (Path(__file__).parent / "scenes.py").read_text()
+    return {node.name for node in ast.parse(source).body if isinstance(node, ast.ClassDef)}
+
+
+def discover_scenes(repo_root: str | Path = REPO_ROOT) -> list[tuple[str, str]]:
+    """(script, scene name) of every Scene subclass in the repo's scripts, found without importing them.
+
+    A class counts when one of its bases is named ``*Scene``, is one of the shared
+    scenes of :mod:`threemds.scenes`, or is a scene class of the same script.
+    """
+    shared = _scene_bases()
+    found = []
+    for file in sorted(Path(repo_root).rglob("*.py")):
+        if {"threemds", "bench", "__pycache__"} & set(file.relative_to(repo_root).parts):
+            continue
+        try:
+            classes = [n for n in ast.parse(file.read_text()).body if isinstance(n, ast.ClassDef)]
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+
+        scenes = set()
+        # repeat until no new class qualifies, a scene may subclass one defined further down
+        while True:
+            new = {c.name for c in classes if c.name not in scenes and any(
+                (name := getattr(b, "id", None) or getattr(b, "attr", None))
+                and (name.endswith("Scene") or name in shared or name in scenes) for b in c.bases)}
+            if not new:
+                break
+            scenes |= new
+        found += [(str(file), c.name) for c in classes if c.name in scenes]
+    return found
+
+
+def _caller_line(file: str) -> int | None:
+    """Line of the script that called ``play``, waits go through ``play`` too."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_filename == file:
+            return frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
+def _bench_scene(file: str, scene_name: str, overrides: dict) -> dict:
+    """Render one scene in this (fresh) worker and measure it."""
+    from manim import config, tempconfig
+
+    from threemds import datasets
+    from threemds.utils import _encode_holds
+
+    datasets.STANDIN_DIR = str(DATASETS_DIR)
+    file = str(Path(file).resolve())
+    animations = []
+    start = time.perf_counter()
+    try:
+        scene_class = getattr(load_script(file), scene_name)
+        with tempconfig(overrides):
+            scene = scene_class()
+            # the same pipeline render_scenes runs
+            _encode_holds(scene)
+
+            play, construct = scene.play, scene.construct
+            construct_seconds = 0.0
+
+            def _play(*args, **kwargs):
+                line = _caller_line(file)
+                play_start = time.perf_counter()
+                play(*args, **kwargs)
+                names = [type(a).__name__.lstrip("_").replace("AnimationBuilder", "animate") for a in args]
+                animations.append({"line": line, "animations": names,
+                                   "seconds": round(time.perf_counter() - play_start, 4)})
+
+            def _construct():
+                nonlocal construct_seconds
+                construct_start = time.perf_counter()
+                try:
+                    construct()
+                finally:
+                    construct_seconds = time.perf_counter() - construct_start
+
+            scene.play, scene.construct = _play, _construct
+            scene.render()
+            render_seconds = time.perf_counter() - start
+
+            frames = round(scene.renderer.time * config.frame_rate)
+            movie_file = getattr(scene.renderer.file_writer, "movie_file_path", None)
+            output_bytes = os.path.getsize(movie_file) if movie_file and os.path.exists(movie_file) else 0
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}", "seconds": round(time.perf_counter() - start, 3)}
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    return {
+        "render_seconds": round(render_seconds, 3),
+        "construct_seconds": round(construct_seconds, 3),
+        "frames": frames,
+        "fps": round(frames / render_seconds, 2) if render_seconds else 0.0,
+        "peak_rss_mb": round(peak_rss / 1024 ** 2, 1),
+        "output_mb": round(output_bytes / 1024 ** 2, 3),
+        "animations": animations,
+    }
+
+
+def run(qualities: list[str] = ("l",), patterns: list[str] = (), jobs: int = 1) -> dict:
+    """Benchmark every discovered scene matching ``patterns`` at each quality, one fresh worker per scene."""
+    import manim
+
+    scenes = [(f, s) for f, s in discover_scenes()
+              if not patterns or any(fnmatch.fnmatch(f"{Path(f).name}::{s}", p) for p in patterns)]
+    results = {}
+    with tempfile.TemporaryDirectory() as media_dir:
+        for q in qualities:
+            work = [(f, s, scene_config(f, q, media_dir=media_dir, preview=False, disable_caching=True,
+                                        write_to_movie=True, verbosity="ERROR", progress_bar="none"))
+                    for f, s in scenes]
+            # a fresh process per scene keeps the peak RSS of each scene its own
+            with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as pool:
+                futures = [pool.submit(_bench_scene, *w) for w in work]
+                for (f, s, _), future in zip(work, futures):
+                    name = f"{Path(f).relative_to(REPO_ROOT)}::{s}@{q}"
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = {"error": f"{type(e).__name__}: {e}"}
+                    print(_format(name, results[name]), flush=True)
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": commit,
+            "manim_version": manim.__version__, "qualities": list(qualities), "results": results}
+
+
+def _format(name: str, r: dict) -> str:
+    if "error" in r:
+        return f"{name:<64} FAILED ({r['error']})"
+    return (f"{name:<64} {r['render_seconds']:8.2f}s {r['fps']:8.1f} fps "
+            f"{r['peak_rss_mb']:8.1f} MB RSS {r['output_mb']:8.2f} MB")
+
+
+def load_history(path: Path = HISTORY_FILE) -> list[dict]:
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def save_run(entry: dict, path: Path = HISTORY_FILE) -> None:
+    history = load_history(path) + [entry]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(history, indent=1))
+    os.replace(tmp, path)
+
+
+def compare(entry: dict, baseline: dict, threshold: float = .1) -> list[str]:
+    """Print every metric next to the baseline, returning the scenes that regressed beyond ``threshold``."""
+    regressions = []
+    for name, r in entry["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or "error" in base or "error" in r:
+            continue
+        changes = []
+        for metric, larger_is_worse in METRICS.items():
+            if not base.get(metric):
+                continue
+            change = r[metric] / base[metric] - 1
+            changes.append(f"{metric} {change:+.0%}")
+            if metric in GATED and (change if larger_is_worse else -change) > threshold:
+                regressions.append(f"{name}: {metric} {base[metric]} -> {r[metric]}")
+        print(f"{name:<64} {', '.join(changes)}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render every scene offline and track render performance.")
+    parser.add_argument("-q", "--quality", nargs="+", default=["l"], choices=list(QUALITIES),
+                        help="quality flags to render at, e.g. -q l k")
+    parser.add_argument("-s", "--scenes", nargs="*", default=[],
+                        help="only scenes matching these globs on 'script.py::SceneName'")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="scenes rendered at once (adds timing noise)")
+    parser.add_argument("--baseline", default="last",
+                        help="history index, 'last', 'none' or a JSON file of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=.1, help="relative slowdown that fails the run")
+    parser.add_argument("--history", default=str(HISTORY_FILE))
+    parser.add_argument("--no-save", action="store_true", help="do not append this run to the history")
+    parser.add_argument("--list", action="store_true", help="only list the discovered scenes")
+    args = parser.parse_args()
+
+    if args.list:
+        for f, s in discover_scenes():
+            print(f"{Path(f).relative_to(REPO_ROOT)}::{s}")
+        sys.exit(0)
+
+    history_file = Path(args.history)
+    history = load_history(history_file)
+    if args.baseline == "none":
+        baseline = None
+    elif args.baseline == "last":
+        baseline = history[-1] if history else None
+    elif args.baseline.lstrip("-").isdigit():
+        baseline = history[int(args.baseline)]
+    else:
+        baseline = json.loads(Path(args.baseline).read_text())
+
+    entry = run(args.quality, args.scenes, args.jobs)
+    if not args.no_save:
+        save_run(entry, history_file)
+
+    failed = [name for name, r in entry["results"].items() if "error" in r]
+    regressions = compare(entry, baseline, args.threshold) if baseline else []
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    sys.exit(1 if failed or regressions else 0)
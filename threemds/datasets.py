@@ -0,0 +1,123 @@
+import hashlib
+import io
+import json
+import os
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from email.utils import formatdate
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# set THREEMDS_OFFLINE=1 on render nodes without network access
+CACHE_DIR = Path(os.environ.get("THREEMDS_CACHE_DIR", Path.home() / ".cache" / "threemds")) / "datasets"
+OFFLINE = os.environ.get("THREEMDS_OFFLINE", "") not in ("", "0")
+# a directory of local CSVs standing in for every URL by file name, e.g. bench/datasets for benchmarks
+STANDIN_DIR = os.environ.get("THREEMDS_DATASET_STANDINS")
+
+
+def _save(df: pd.DataFrame, path: Path) -> Path:
+    # write next to the target and rename, render workers may cache the same file at once
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp)
+        path = path.with_suffix(".parquet")
+    except ImportError:
+        # no parquet engine installed, fall back to one npy array per column
+        with open(tmp, "wb") as fp:
+            np.savez(fp, **{str(c): df[c].to_numpy() for c in df.columns})
+        path = path.with_suffix(".npz")
+    os.replace(tmp, path)
+    return path
+
+
+def _write_index(index_file: Path, entry: dict) -> None:
+    tmp = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(entry))
+    os.replace(tmp, index_file)
+
+
+def _load(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    with np.load(path, allow_pickle=True) as columns:
+        return pd.DataFrame({c: columns[c] for c in columns.files})
+
+
+def _fetch(url: str, entry: dict | None, timeout: float):
+    """GET ``url``, conditional on the cached entry. Returns None when it is unchanged."""
+    request = urllib.request.Request(url)
+    if entry:
+        if entry.get("etag"):
+            request.add_header("If-None-Match", entry["etag"])
+        request.add_header("If-Modified-Since", entry.get("last_modified") or formatdate(entry["fetched"], usegmt=True))
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.read(), response.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        raise
+
+
+def load_csv(url: str, revalidate: bool | None = None, cache_dir: str | Path | None = None,
+             timeout: float = 10.0, **read_csv_kwargs) -> pd.DataFrame:
+    """``pd.read_csv(url)`` backed by an on-disk cache.
+
+    The first load downloads the CSV and stores it as a columnar file named by the hash of
+    its content and ``read_csv_kwargs``. Later loads revalidate with the server's
+    ETag/Last-Modified and read from disk. With ``revalidate=False`` (the default when
+    THREEMDS_OFFLINE is set) cached datasets are served without touching the network,
+    and a failed revalidation also falls back to the cached copy.
+
+    With STANDIN_DIR set, the CSV of the same file name in there is read instead and
+    neither the network nor the cache is touched.
+    """
+    if STANDIN_DIR:
+        return pd.read_csv(Path(STANDIN_DIR) / Path(urllib.parse.urlparse(url).path).name, **read_csv_kwargs)
+
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    revalidate = not OFFLINE if revalidate is None else revalidate
+
+    key = hashlib.sha256(json.dumps([url, read_csv_kwargs], sort_keys=True, default=str).encode()).hexdigest()
+    index_file = cache_dir / f"{key}.json"
+    entry = json.loads(index_file.read_text()) if index_file.exists() else None
+    if entry and not (cache_dir / entry["file"]).exists():
+        entry = None
+
+    if entry and not revalidate:
+        return _load(cache_dir / entry["file"])
+    if not entry and not revalidate:
+        raise FileNotFoundError(f"{url} is not cached in {cache_dir} and revalidation is off")
+
+    try:
+        fetched = _fetch(url, entry, timeout)
+    except (urllib.error.URLError, OSError):
+        if entry:
+            return _load(cache_dir / entry["file"])
+        raise
+
+    if fetched is None:
+        entry["fetched"] = time.time()
+        _write_index(index_file, entry)
+        return _load(cache_dir / entry["file"])
+
+    content, headers = fetched
+    # the same CSV parsed with other read_csv arguments is another table
+    name = hashlib.sha256(content + json.dumps(read_csv_kwargs, sort_keys=True, default=str).encode()).hexdigest()
+    df = pd.read_csv(io.BytesIO(content), **read_csv_kwargs)
+    existing = [p for p in cache_dir.glob(f"{name}.*") if p.suffix in (".parquet", ".npz")]
+    file = existing[0] if existing else _save(df, cache_dir / name)
+
+    _write_index(index_file, {
+        "url": url,
+        "file": file.name,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "fetched": time.time(),
+    })
+    return df
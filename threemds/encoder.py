@@ -0,0 +1,269 @@
+import multiprocessing as mp
+import os
+import queue
+import subprocess
+import time
+import types
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+# frames the shared ring holds, the rasterizer only waits on the encoder once all of them are queued
+RING_SLOTS = int(os.environ.get("THREEMDS_RING_SLOTS", 8))
+
+
+class FrameRing:
+    """``slots`` RGBA frames of ``shape`` in one shared memory block, as ndarray views."""
+
+    def __init__(self, shape: tuple, slots: int, name: str | None = None):
+        self.shape, self.slots = tuple(shape), slots
+        self.frame_bytes = int(np.prod(self.shape))
+        if name is None:
+            self.shm = SharedMemory(create=True, size=self.frame_bytes * slots)
+        else:
+            # spawned children share the creator's resource tracker, which unlinks the block once
+            self.shm = SharedMemory(name=name)
+        self.frames = [np.ndarray(self.shape, dtype=np.uint8, buffer=self.shm.buf, offset=i * self.frame_bytes)
+                       for i in range(slots)]
+
+    def close(self, unlink: bool = False) -> None:
+        # views must go before the mapping can
+        self.frames = []
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def _encode(name: str, shape: tuple, slots: int, commands, free, done) -> None:
+    """The encoder process: feeds ring slots to ffmpeg as the renderer queues them.
+
+    Commands are ("open", ffmpeg command), ("frame", slot, repeats), ("close",),
+    ("sync",) and ("stop",). Every frame hands its slot back on ``free``; sync and stop
+    answer on ``done``.
+    """
+    ring = FrameRing(shape, slots, name)
+    process, error = None, None
+    frames, busy, start = 0, 0.0, time.perf_counter()
+    while True:
+        command, *args = commands.get()
+        started = time.perf_counter()
+        if command == "frame":
+            slot, repeats = args
+            if process is not None and error is None:
+                try:
+                    for _ in range(repeats):
+                        process.stdin.write(ring.frames[slot])
+                except OSError as e:
+                    error = f"{type(e).__name__}: {e}"
+            frames += repeats
+            free.put(slot)
+        elif command == "open":
+            process = subprocess.Popen(args[0], stdin=subprocess.PIPE)
+        elif command == "close":
+            process.stdin.close()
+            if process.wait() and error is None:
+                error = f"ffmpeg exited with status {process.returncode}"
+            process = None
+        elif command == "sync":
+            done.put(error)
+        elif command == "stop":
+            done.put({"error": error, "frames": frames, "busy": busy, "wall": time.perf_counter() - start})
+            break
+        busy += time.perf_counter() - started
+    ring.close()
+
+
+class AsyncEncoder:
+    """Frames go to ffmpeg from a separate encoder process, through a shared memory ring.
+
+    The renderer copies each frame into a free slot of the ring and moves on, and the
+    encoder process writes slots to ffmpeg while the next frames rasterize, so Cairo
+    and H.264 run on separate cores. With all slots queued the renderer waits for one
+    to free up. Partial movies finish in the background and are waited for before
+    manim concatenates them. The ffmpeg commands are manim's own.
+    """
+
+    def __init__(self, scene, slots: int = RING_SLOTS):
+        self.scene = scene
+        self.renderer = scene.renderer
+        self.ring = FrameRing(self.renderer.camera.pixel_array.shape, slots)
+        context = mp.get_context("spawn")
+        self.commands, self.free, self.done = context.Queue(), context.Queue(), context.Queue()
+        for slot in range(slots):
+            self.free.put(slot)
+        self.process = context.Process(target=_encode, daemon=True, args=(
+            self.ring.shm.name, self.ring.shape, slots, self.commands, self.free, self.done))
+        self.frames = 0
+        self.wait_seconds = 0.0
+        self.start = None
+        self._restore = []
+
+    def _get(self, q):
+        # a dead encoder would otherwise leave the renderer waiting forever
+        while True:
+            try:
+                return q.get(timeout=1)
+            except queue.Empty:
+                if not self.process.is_alive():
+                    raise RuntimeError(f"encoder process exited with status {self.process.exitcode}")
+
+    def slot(self) -> int:
+        start = time.perf_counter()
+        slot = self._get(self.free)
+        self.wait_seconds += time.perf_counter() - start
+        return slot
+
+    def add_frame(self, frame: np.ndarray, num_frames: int = 1):
+        # CairoRenderer.add_frame, queueing the frame once however often it repeats
+        dt = 1 / self.renderer.camera.frame_rate
+        if self.renderer.skip_animations:
+            return
+        self.renderer.time += num_frames * dt
+        slot = self.slot()
+        np.copyto(self.ring.frames[slot], frame)
+        self.commands.put(("frame", slot, num_frames))
+        self.frames += num_frames
+
+    def render(self, scene, time, moving_mobjects):
+        # CairoRenderer.render, minus get_frame()'s copy of the camera array
+        self.renderer.update_frame(scene, moving_mobjects)
+        self.add_frame(self.renderer.camera.pixel_array)
+
+    def sync(self) -> None:
+        """Wait until every queued frame is encoded and every closed partial movie written."""
+        self.commands.put(("sync",))
+        error = self._get(self.done)
+        if error:
+            raise RuntimeError(f"encoder: {error}")
+
+    def install(self) -> "AsyncEncoder":
+        from manim.scene import scene_file_writer
+
+        writer = self.renderer.file_writer
+        open_movie_pipe, finish = writer.open_movie_pipe, writer.finish
+
+        def _open_movie_pipe(file_path=None):
+            # let manim build its ffmpeg command and partial movie path, then start it in the encoder
+            commands = []
+            real_subprocess = scene_file_writer.subprocess
+            scene_file_writer.subprocess = types.SimpleNamespace(
+                PIPE=subprocess.PIPE, Popen=lambda command, **kwargs: commands.append(command))
+            try:
+                open_movie_pipe(file_path)
+            finally:
+                scene_file_writer.subprocess = real_subprocess
+            # writing_process is now None, so threemds.utils._encode_holds leaves waits to add_frame
+            self.commands.put(("open", commands[0]))
+
+        def _close_movie_pipe():
+            self.commands.put(("close",))
+
+        def _finish():
+            self.sync()
+            # manim terminates writing_process when it has one
+            writer.__dict__.pop("writing_process", None)
+            finish()
+
+        self._restore = [(self.renderer, "add_frame", self.renderer.add_frame),
+                         (self.renderer, "render", self.renderer.render),
+                         (writer, "open_movie_pipe", open_movie_pipe),
+                         (writer, "close_movie_pipe", writer.close_movie_pipe),
+                         (writer, "finish", finish)]
+        self.renderer.add_frame, self.renderer.render = self.add_frame, self.render
+        writer.open_movie_pipe, writer.close_movie_pipe, writer.finish = _open_movie_pipe, _close_movie_pipe, _finish
+
+        self.process.start()
+        self.start = time.perf_counter()
+        return self
+
+    def stats(self, encoder: dict) -> str:
+        wall = time.perf_counter() - self.start
+        return (f"{type(self.scene).__name__}: {self.frames} frames, renderer busy "
+                f"{1 - self.wait_seconds / wall:.0%} ({self.wait_seconds:.1f}s waiting on the encoder), "
+                f"encoder busy {encoder['busy'] / encoder['wall']:.0%}")
+
+    def finish(self) -> None:
+        try:
+            if self.process.is_alive():
+                self.commands.put(("stop",))
+                encoder = self._get(self.done)
+                print(self.stats(encoder), flush=True)
+            self.process.join()
+        finally:
+            for owner, name, original in self._restore:
+                setattr(owner, name, original)
+            self.ring.close(unlink=True)
+
+
+class ZeroCopyEncoder(AsyncEncoder):
+    """:class:`AsyncEncoder` with the camera drawing straight into the ring, so the renderer copies no frames.
+
+    Every ``update_frame`` points the camera's pixel array at a slot nobody holds, and
+    the slot goes to the encoder process as is. A wait freezes the slot the camera is
+    on, for any number of frames. Only frames that come from elsewhere are copied into
+    a slot, and the bytes copied per frame are reported with the stats. Past the ring
+    nothing changes: the encoder process writes every slot into ffmpeg's stdin, once
+    per frame, like manim does.
+    """
+
+    def __init__(self, scene, slots: int = RING_SLOTS):
+        super().__init__(scene, slots)
+        self.camera = self.renderer.camera
+        # frames of each slot queued to the encoder, the prefilled free queue releases each slot once
+        self.pending = [1] * slots
+        self.current = None
+        self.bytes_copied = 0
+
+    def slot(self) -> int:
+        # the camera's slot may still be frozen by a wait, so it is never handed out again right away
+        while not (free := [s for s, n in enumerate(self.pending) if n == 0 and s != self.current]):
+            self.pending[super().slot()] -= 1
+        return free[0]
+
+    def update_frame(self, scene, mobjects=None, include_submobjects: bool = True, ignore_skipping: bool = True,
+                     **kwargs):
+        if self.renderer.skip_animations and not ignore_skipping:
+            return
+        self.current = self.slot()
+        # Camera.reset() and set_frame_to_background() write in place, so the frame is drawn into the slot
+        self.camera.pixel_array = self.ring.frames[self.current]
+        self._update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+
+    def add_frame(self, frame: np.ndarray, num_frames: int = 1):
+        dt = 1 / self.renderer.camera.frame_rate
+        if self.renderer.skip_animations:
+            return
+        self.renderer.time += num_frames * dt
+        if self.current is not None and frame is self.ring.frames[self.current]:
+            slot = self.current
+        else:
+            slot = self.slot()
+            np.copyto(self.ring.frames[slot], frame)
+            self.bytes_copied += frame.nbytes
+        self.pending[slot] += 1
+        self.commands.put(("frame", slot, num_frames))
+        self.frames += num_frames
+
+    def freeze_current_frame(self, duration: float):
+        # CairoRenderer.freeze_current_frame, without get_frame()'s copy
+        dt = 1 / self.camera.frame_rate
+        self.add_frame(self.camera.pixel_array, int(duration / dt))
+
+    def install(self) -> "ZeroCopyEncoder":
+        super().install()
+        self._update_frame = self.renderer.update_frame
+        self._restore += [(self.renderer, "update_frame", self.renderer.update_frame),
+                          (self.renderer, "freeze_current_frame", self.renderer.freeze_current_frame)]
+        self.renderer.update_frame, self.renderer.freeze_current_frame = self.update_frame, self.freeze_current_frame
+        return self
+
+    def stats(self, encoder: dict) -> str:
+        frames = max(self.frames, 1)
+        return (f"{super().stats(encoder)}, {self.bytes_copied / frames:,.0f} bytes copied per frame "
+                f"by the renderer, {self.ring.frame_bytes:,} through ffmpeg's pipe")
+
+    def finish(self) -> None:
+        # the camera and its cached cairo contexts must let go of the ring before it is unmapped
+        self.camera.pixel_array = np.array(self.camera.pixel_array)
+        self.camera.pixel_array_to_cairo_context = {}
+        super().finish()
@@ -0,0 +1,156 @@
+import argparse
+import re
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# everything a kdenlive bin can hold, anything else in a media directory is left alone
+MEDIA_SUFFIXES = {
+    ".m4a", ".mp3", ".wav", ".aac", ".flac", ".ogg", ".opus",
+    ".mp4", ".mov", ".mkv", ".webm", ".avi", ".gif",
+    ".png", ".jpg", ".jpeg", ".svg", ".webp",
+}
+
+# voiceover takes and other audio, the only media flagged by default in a project's own directory,
+# where its videos and images are exports, thumbnails and artwork no project references
+AUDIO_SUFFIXES = {".m4a", ".mp3", ".wav", ".aac", ".flac", ".ogg", ".opus"}
+
+# MLT properties that hold a file, the proxy and original url included so those stay too
+RESOURCE_PROPERTIES = {"resource", "warp_resource", "kdenlive:originalurl", "kdenlive:proxy"}
+
+# timewarp producers prefix the file with their speed, "0.5:clip.mp4"
+TIMEWARP = re.compile(r"^-?\d+(?:\.\d+)?:(.+)$")
+
+
+def _rebase(path: Path, root: Path, project_dir: Path) -> Path:
+    """Map a path of the machine that saved the project onto this checkout.
+
+    ``root`` is where the project lived when saved and ``project_dir`` where it is now,
+    so their common trailing directories give the prefix to swap, e.g.
+    /Users/someone/git/3mds -> /home/else/3mds for every absolute path under it.
+    """
+    common = 0
+    for old, new in zip(reversed(root.parts), reversed(project_dir.parts)):
+        if old != new:
+            break
+        common += 1
+    old_prefix = Path(*root.parts[:len(root.parts) - common])
+    new_prefix = Path(*project_dir.parts[:len(project_dir.parts) - common])
+    try:
+        return new_prefix / path.relative_to(old_prefix)
+    except ValueError:
+        return path
+
+
+def _locate(value: str, root: Path, project_dir: Path) -> Path:
+    path = Path(value)
+    if not path.is_absolute():
+        path = root / path
+    return Path(_rebase(path, root, project_dir).resolve())
+
+
+def _resolve(value: str, root: Path, project_dir: Path) -> Path:
+    path = _locate(value, root, project_dir)
+    # a file really named like "0.5:clip.mp4" wins over the timewarp reading
+    match = TIMEWARP.match(value)
+    if match and not path.exists():
+        path = _locate(match[1], root, project_dir)
+    return path
+
+
+def referenced_files(project: str | Path) -> set[Path]:
+    """Every file a .kdenlive project references, resolved against its ``root``.
+
+    The MLT XML is stream-parsed once and each element dropped once read, so the
+    size of the project does not matter.
+    """
+    project = Path(project).resolve()
+    root = project.parent
+    files = set()
+    for event, elem in ET.iterparse(project, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "mlt" and elem.get("root"):
+                root = Path(elem.get("root"))
+            continue
+        if elem.tag == "property" and elem.get("name") in RESOURCE_PROPERTIES and elem.text:
+            files.add(_resolve(elem.text.strip(), root, project.parent))
+        if elem.tag != "mlt":
+            elem.clear()
+    return files
+
+
+def find_projects(repo_root: str | Path = ".") -> list[Path]:
+    return sorted(p for p in Path(repo_root).rglob("*.kdenlive") if "trash" not in p.parts)
+
+
+def media_dirs_of(projects: list[Path], repo_root: str | Path = ".") -> list[Path]:
+    """The directories of the repo that ``projects`` take media from, i.e. that hold a file they reference."""
+    repo_root = Path(repo_root).resolve()
+    dirs = set()
+    for project in projects:
+        dirs |= {f.parent for f in referenced_files(project)
+                 if f.is_file() and f.is_relative_to(repo_root) and "trash" not in f.parts}
+    return sorted(dirs)
+
+
+def unreferenced_media(projects: list[Path], media_dirs: list[Path], recursive: bool = True,
+                       suffixes: set[str] = MEDIA_SUFFIXES) -> list[Path]:
+    """Files with ``suffixes`` in ``media_dirs``, and below them if ``recursive``, that no project references."""
+    referenced = set()
+    for project in projects:
+        referenced |= referenced_files(project)
+
+    unreferenced = []
+    for media_dir in media_dirs:
+        for f in sorted(Path(media_dir).rglob("*") if recursive else Path(media_dir).iterdir()):
+            if f.is_file() and f.suffix.lower() in suffixes and f.resolve() not in referenced:
+                unreferenced.append(f)
+    return unreferenced
+
+
+def cleanup(repo_root: str | Path = ".", media_dirs: list[str | Path] | None = None,
+            trash: bool = False) -> list[Path]:
+    """Report, and with ``trash`` move away, media no .kdenlive project under ``repo_root`` uses.
+
+    ``media_dirs`` defaults to every directory of the repo some project takes a file
+    from (:func:`media_dirs_of`), each checked without its subdirectories, so manim's
+    render folders and the asset folders of all projects are covered in one pass.
+    Inside a project's own directory only audio is checked by default, the finished
+    exports, thumbnails and artwork kept there are never referenced by the project.
+    Given directories are checked recursively for every kind of media. Trashed files
+    go to a ``trash`` directory next to their media directory, keeping their path
+    below it, so a wrong call is undone by moving them back.
+    """
+    projects = find_projects(repo_root)
+    if media_dirs is None:
+        project_dirs = [p.parent.resolve() for p in projects]
+        media_dirs = media_dirs_of(projects, repo_root)
+        in_project = [d for d in media_dirs if any(d.is_relative_to(p) for p in project_dirs)]
+        unreferenced = unreferenced_media(projects, [d for d in media_dirs if d not in in_project], False) \
+            + unreferenced_media(projects, in_project, False, AUDIO_SUFFIXES)
+    else:
+        media_dirs = [Path(d).resolve() for d in media_dirs]
+        unreferenced = unreferenced_media(projects, media_dirs)
+
+    for f in unreferenced:
+        # the innermost one, default directories can nest
+        media_dir = max((d for d in media_dirs if f.resolve().is_relative_to(d)), key=lambda d: len(d.parts))
+        if trash:
+            target = media_dir.parent / "trash" / f.relative_to(media_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(f, target)
+            print(f"trashed {f}")
+        else:
+            print(f"unreferenced {f}")
+    return unreferenced
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find media no .kdenlive project in the repo references.")
+    parser.add_argument("repo_root", nargs="?", default=".")
+    parser.add_argument("--media", action="append", help="media directory to check, repeatable "
+                                                         "(default: every directory a project takes files from, "
+                                                         "audio only inside a project's own directory)")
+    parser.add_argument("--trash", action="store_true", help="move unreferenced media to trash/")
+    args = parser.parse_args()
+    cleanup(args.repo_root, args.media, args.trash)
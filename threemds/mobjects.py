@@ -0,0 +1,387 @@
+import numpy as np
+from manim import (BLUE, DEFAULT_DASH_LENGTH, DEFAULT_DOT_RADIUS, DEFAULT_FONT_SIZE, TAU, WHITE, Animation, MathTex,
+                   VGroup, VMobject, color_to_rgb, integer_interpolate, linear, partial_bezier_points, rgb_to_hex)
+
+from threemds.trackers import dependency_state, update_counts
+
+
+def _marker_template(n_arcs: int = 8) -> np.ndarray:
+    """Bezier control points of a unit circle, 4 points per cubic arc, like :class:`Circle`."""
+    angles = np.linspace(0, TAU, n_arcs + 1)
+    start, end = angles[:-1], angles[1:]
+    handle = 4 / 3 * np.tan((end - start) / 4)
+
+    p0 = np.stack([np.cos(start), np.sin(start)], axis=1)
+    p3 = np.stack([np.cos(end), np.sin(end)], axis=1)
+    p1 = p0 + handle[:, None] * np.stack([-np.sin(start), np.cos(start)], axis=1)
+    p2 = p3 - handle[:, None] * np.stack([-np.sin(end), np.cos(end)], axis=1)
+
+    curves = np.stack([p0, p1, p2, p3], axis=1).reshape(-1, 2)
+    return np.hstack([curves, np.zeros((len(curves), 1))])
+
+
+MARKER = _marker_template()
+
+
+class PointCloudPlot(VGroup):
+    """Scatter plot markers for whole arrays of data, in place of one :class:`Dot` per row.
+
+    The coordinates go through ``ax.c2p`` in one vectorized call and every marker
+    becomes a closed subpath of a single VMobject per distinct color, so building and
+    drawing 10k points costs a handful of mobjects. ``color`` and ``radius`` take either
+    one value or one value per point.
+    """
+
+    def __init__(self, ax, x, y, color=BLUE, radius: float = DEFAULT_DOT_RADIUS, **kwargs):
+        super().__init__(**kwargs)
+        self.ax = ax
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+
+        n = len(self.x)
+        self.centers = ax.c2p(self.x, self.y).T if n else np.zeros((0, 3))
+        self.radii = np.broadcast_to(np.asarray(radius, dtype=float), (n,)).copy()
+        self.colors = [color] * n if np.ndim(color) == 0 else list(color)
+
+        # one VMobject per color, remembering which rows went into which. Grouped by hex
+        # string, manim 0.18's ManimColor compares equal but is not hashable
+        self.indices = []
+        hexes = np.array([rgb_to_hex(color_to_rgb(c)) for c in self.colors])
+        for h in dict.fromkeys(hexes):
+            rows = np.flatnonzero(hexes == h)
+            markers = VMobject(fill_color=self.colors[rows[0]], fill_opacity=1, stroke_width=0)
+            markers.set_points(self.marker_points(self.centers[rows], self.radii[rows]))
+            self.add(markers)
+            self.indices.append(rows)
+
+    @staticmethod
+    def marker_points(centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        return (centers[:, None, :] + radii[:, None, None] * MARKER[None]).reshape(-1, 3)
+
+    def get_centers(self) -> np.ndarray:
+        """Current marker centers, following any shift/scale applied to the cloud."""
+        centers = np.zeros((len(self.x), 3))
+        for markers, rows in zip(self.submobjects, self.indices):
+            centers[rows] = markers.points.reshape(len(rows), len(MARKER), 3).mean(axis=1)
+        return centers
+
+
+class WritePoints(Animation):
+    """Draw the markers of a :class:`PointCloudPlot` one after another, as ``Write`` draws a :class:`Dot`.
+
+    The vectorized equivalent of ``LaggedStart(*[Write(dot) for dot in dots], lag_ratio=...)``:
+    each marker strokes its outline in the first half of its run and fills in as the
+    stroke fades in the second. Finished markers are drawn from the cloud's own
+    VMobjects, and only the few markers in flight at once get one of their own, so a
+    frame costs a NumPy pass over the cloud plus a handful of small mobjects.
+    """
+
+    def __init__(self, cloud: PointCloudPlot, lag_ratio: float = .05, rate_func=linear,
+                 stroke_width: float = 2, **kwargs):
+        # as long as the LaggedStart of 1s Writes it replaces
+        kwargs.setdefault("run_time", 1 + max(len(cloud.x) - 1, 0) * lag_ratio)
+        super().__init__(cloud, lag_ratio=lag_ratio, rate_func=rate_func, **kwargs)
+        self.stroke_width = stroke_width
+
+    def begin(self) -> None:
+        n = len(self.mobject.x)
+        self.start_points = [m.points.reshape(len(rows), len(MARKER), 3).copy()
+                             for m, rows in zip(self.mobject.submobjects, self.mobject.indices)]
+        # at most 1 / lag_ratio + 1 markers are in flight at any time
+        in_flight = n if self.lag_ratio == 0 else min(n, int(1 / self.lag_ratio) + 2)
+        self.in_flight = [VMobject() for _ in range(in_flight)]
+        super().begin()
+        self.mobject.add(*self.in_flight)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        n = len(self.mobject.x)
+        sub_alphas = np.clip(alpha * ((n - 1) * self.lag_ratio + 1) - np.arange(n) * self.lag_ratio, 0, 1)
+        in_flight = (sub_alphas > 0) & (sub_alphas < 1)
+        sub_alphas[in_flight] = [self.rate_func(a) for a in sub_alphas[in_flight]]
+
+        flying = []
+        for markers, rows, points in zip(self.mobject.submobjects, self.mobject.indices, self.start_points):
+            done = sub_alphas[rows] >= 1
+            markers.set_points(points[done].reshape(-1, 3))
+            flying += [(row, marker) for row, marker, flies in zip(rows, points, in_flight[rows]) if flies]
+
+        for mob, (row, marker) in zip(self.in_flight, sorted(flying, key=lambda f: f[0])):
+            color, sub_alpha = self.mobject.colors[row], sub_alphas[row]
+            if sub_alpha < .5:
+                # DrawBorderThenFill's first half, the outline up to 2 * sub_alpha of the way round
+                curves = marker.reshape(-1, 4, 3)
+                index, residue = integer_interpolate(0, len(curves), 2 * sub_alpha)
+                mob.set_points(np.vstack([*curves[:index], partial_bezier_points(curves[index], 0, residue)]))
+                mob.set_fill(color, opacity=0).set_stroke(color, width=self.stroke_width)
+            else:
+                mob.set_points(marker)
+                fill = 2 * sub_alpha - 1
+                mob.set_fill(color, opacity=fill).set_stroke(color, width=self.stroke_width * (1 - fill))
+        for mob in self.in_flight[len(flying):]:
+            mob.clear_points()
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject.remove(*self.in_flight)
+
+
+def _evaluate(function, xs: np.ndarray) -> np.ndarray:
+    """Evaluate ``function`` on an array, falling back to one call per x for scalar-only functions."""
+    try:
+        ys = np.asarray(function(xs), dtype=float)
+        if ys.shape == xs.shape:
+            return ys
+    except (TypeError, ValueError):
+        pass
+    return np.array([function(x) for x in xs], dtype=float)
+
+
+class Tracked(VMobject):
+    """A VMobject that recomputes its points from ValueTrackers every frame.
+
+    Unlike ``always_redraw``, which builds a whole new mobject per frame and
+    ``become()``s it, subclasses only rewrite the point array of this one mobject.
+    Like ``always_redraw``, copies are static snapshots.
+
+    With ``depends_on`` (ValueTrackers, :class:`Derived` values, axes or small
+    mobjects, see :func:`dependency_state`) a frame in which none of them changed skips
+    the recompute, e.g. during a ``wait()``. Without it, every frame recomputes.
+    """
+
+    def __init__(self, depends_on=(), **kwargs):
+        super().__init__(**kwargs)
+        self.depends_on = tuple(depends_on)
+        self.state = dependency_state(self.depends_on)
+        # recomputes so far, what mobjects depending on this one compare, see dependency_state
+        self.version = 0
+        self.recompute()
+        # the mobject it runs on rather than self, copies drop it, see __deepcopy__
+        self.add_updater(lambda m: m.update_from_dependencies())
+
+    def __deepcopy__(self, memo):
+        # copies (copy(), animate targets) are static snapshots, their updater would
+        # recompute from the copied trackers and axes
+        result = super().__deepcopy__(memo)
+        result.clear_updaters(recursive=False)
+        return result
+
+    def update_from_dependencies(self):
+        if self.depends_on:
+            state = dependency_state(self.depends_on)
+            if state == self.state:
+                update_counts["skipped"] += 1
+                return self
+            self.state = state
+        update_counts["executed"] += 1
+        self.version += 1
+        return self.recompute()
+
+    def recompute(self):
+        raise NotImplementedError()
+
+
+class TrackedPlot(Tracked):
+    """``always_redraw(lambda: ax.plot(function, x_range=...))`` without the per-frame rebuild.
+
+    ``x_range`` is an (x_min, x_max) tuple or a callable returning one, and defaults to
+    the axes' range. The function is sampled as densely as ``ax.plot`` samples it.
+    """
+
+    def __init__(self, ax, function, x_range=None, use_smoothing: bool = True, **kwargs):
+        self.ax = ax
+        self.function = self.underlying_function = function
+        self.x_range = x_range if x_range is not None else tuple(ax.x_range[:2])
+        self.x_step = ax.x_range[2] / ax.num_sampled_graph_points_per_tick
+        self.use_smoothing = use_smoothing
+        super().__init__(**kwargs)
+
+    def get_x_range(self) -> tuple[float, float]:
+        return self.x_range() if callable(self.x_range) else self.x_range
+
+    def sample(self) -> tuple[np.ndarray, np.ndarray]:
+        x_min, x_max = self.get_x_range()
+        xs = np.append(np.arange(x_min, x_max, self.x_step), x_max)
+        if len(xs) == 1:
+            # empty range, keep a degenerate segment so there is still something to fade in
+            xs = np.array([x_min, x_max])
+        return xs, _evaluate(self.function, xs)
+
+    def recompute(self):
+        xs, ys = self.sample()
+        points = self.ax.c2p(xs, ys).T
+        if self.use_smoothing:
+            self.set_points_smoothly(points)
+        else:
+            self.set_points_as_corners(points)
+        return self
+
+
+class TrackedArea(TrackedPlot):
+    """``always_redraw(lambda: ax.get_area(graph, x_range=...))`` without the per-frame rebuild.
+
+    Takes the function of the graph rather than the graph itself, and is styled like
+    :meth:`Axes.get_area`.
+    """
+
+    def __init__(self, ax, function, x_range=None, color=BLUE, opacity: float = .3, **kwargs):
+        super().__init__(ax, function, x_range, use_smoothing=False, **kwargs)
+        self.set_opacity(opacity).set_color(color)
+
+    def recompute(self):
+        xs, ys = self.sample()
+        curve = self.ax.c2p(xs, ys).T
+        base = self.ax.c2p([xs[-1], xs[0]], [0, 0]).T
+        self.set_points_as_corners(np.vstack([base[1:], curve, base, base[1:]]))
+        return self
+
+
+class TrackedLine(Tracked):
+    """``always_redraw(lambda: Line(start, end))`` or ``DashedLine`` without the per-frame rebuild.
+
+    ``start`` and ``end`` are callables returning points. Dashes are laid out like
+    :class:`DashedLine`, as separate subpaths of this one VMobject.
+    """
+
+    def __init__(self, start, end, dashed: bool = False, dash_length: float = DEFAULT_DASH_LENGTH,
+                 dashed_ratio: float = .5, **kwargs):
+        self.start, self.end = start, end
+        self.dashed = dashed
+        self.dash_length = dash_length
+        self.dashed_ratio = dashed_ratio
+        super().__init__(**kwargs)
+
+    def recompute(self):
+        start, end = np.asarray(self.start(), dtype=float), np.asarray(self.end(), dtype=float)
+        if not self.dashed:
+            self.set_points_as_corners([start, end])
+            return self
+
+        # open paths start and end with a dash, see DashedVMobject
+        r = self.dashed_ratio
+        n = max(2, int(np.ceil(np.linalg.norm(end - start) / self.dash_length * r)))
+        dash_len, void_len = r / n, (1 - r) / (n - 1)
+        alphas = np.arange(n)[:, None] * (dash_len + void_len) + np.linspace(0, dash_len, 4)[None, :]
+        self.set_points(start + alphas.reshape(-1, 1) * (end - start))
+        return self
+
+
+# every character a number label can need, typeset together so they share a baseline
+GLYPHS = "-0123456789."
+# glyph points and advances by font size, see _glyph_atlas
+_atlases = {}
+
+
+def _glyph_atlas(font_size: float) -> dict[str, tuple[np.ndarray, float]]:
+    """Points of each character in GLYPHS relative to its pen position on the baseline, and its advance."""
+    if font_size not in _atlases:
+        glyphs = MathTex(GLYPHS, font_size=font_size).family_members_with_points()
+        lefts = [g.get_left()[0] for g in glyphs]
+        baseline = glyphs[1].get_bottom()[1]
+
+        # digits share one advance, the minus runs up to the 0 and the point gets even side bearings
+        advance = (lefts[10] - lefts[1]) / 9
+        pens = [lefts[0], *(lefts[1] + i * advance for i in range(11))]
+        advances = [lefts[1] - lefts[0], *[advance] * 10, 2 * (lefts[11] - pens[11]) + glyphs[11].width]
+
+        _atlases[font_size] = {c: (g.points - [pen, baseline, 0], adv)
+                               for c, g, pen, adv in zip(GLYPHS, glyphs, pens, advances)}
+    return _atlases[font_size]
+
+
+class FastNumberLabel(VMobject):
+    """A number label for values that change every frame, in place of rebuilding a ``DecimalNumber``.
+
+    The glyphs are typeset once per font size, and :meth:`set_value` lays out copies of
+    their points as subpaths of this one VMobject, so a new value never goes through
+    LaTeX. Keeps its scale and center across values, so it can follow other mobjects
+    with ``next_to`` from an updater.
+    """
+
+    def __init__(self, number: float = 0, num_decimal_places: int = 2, font_size: float = DEFAULT_FONT_SIZE,
+                 color=WHITE, **kwargs):
+        self.num_decimal_places = num_decimal_places
+        self.font_size = font_size
+        self.scale_factor = 1.0
+        super().__init__(fill_color=color, fill_opacity=1, stroke_width=0, **kwargs)
+        self.set_value(number)
+
+    def glyph_points(self, text: str) -> np.ndarray:
+        atlas = _glyph_atlas(self.font_size)
+        points, pen = [], 0.0
+        for c in text:
+            glyph, advance = atlas[c]
+            points.append(glyph + [pen, 0, 0])
+            pen += advance
+        return np.vstack(points)
+
+    def set_value(self, number: float):
+        center = self.get_center() if self.has_points() else None
+        self.number = number
+        self.set_points(self.glyph_points(f"{number:.{self.num_decimal_places}f}") * self.scale_factor)
+        return self.move_to(center) if center is not None else self.center()
+
+    def get_value(self) -> float:
+        return self.number
+
+    def scale(self, scale_factor: float, **kwargs):
+        # remembered so the next value comes out at the same size
+        self.scale_factor *= scale_factor
+        return super().scale(scale_factor, **kwargs)
+
+
+class ArcLengthTable:
+    """Cumulative curve lengths of a VMobject, for proportion-to-point lookups without re-measuring.
+
+    ``VMobject.point_from_proportion`` measures every curve in Python on each call. The table
+    measures them once, the same way (``sample_points`` chords per cubic curve), and answers
+    with a binary search, for one alpha or an array of them. It is rebuilt whenever the
+    mobject's points no longer match the ones it was built from.
+    """
+
+    def __init__(self, vmobject: VMobject, sample_points: int = 10):
+        self.vmobject = vmobject
+        self.sample_points = sample_points
+        self.points = None
+
+    def refresh(self) -> None:
+        points = self.vmobject.points
+        if self.points is not None and np.array_equal(points, self.points):
+            return
+        self.points = points.copy()
+        n = self.vmobject.n_points_per_cubic_curve
+        self.curves = points[:len(points) // n * n].reshape(-1, n, 3)
+
+        samples = self.evaluate(np.arange(len(self.curves)), np.linspace(0, 1, self.sample_points)[:, None])
+        self.lengths = np.linalg.norm(np.diff(samples, axis=0), axis=2).sum(axis=0)
+        self.cumulative = np.concatenate([[0], np.cumsum(self.lengths)])
+
+    def evaluate(self, curve: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """Points at ``t`` along the cubic bezier curves with indices ``curve``."""
+        p0, p1, p2, p3 = np.moveaxis(self.curves[curve], -2, 0)
+        t = t[..., None]
+        return (1 - t) ** 3 * p0 + 3 * (1 - t) ** 2 * t * p1 + 3 * (1 - t) * t ** 2 * p2 + t ** 3 * p3
+
+    def point_from_proportion(self, alpha):
+        """Same points as ``VMobject.point_from_proportion``, for a scalar or an array of alphas."""
+        self.refresh()
+        alpha = np.asarray(alpha, dtype=float)
+        if np.any((alpha < 0) | (alpha > 1)):
+            raise ValueError(f"Alpha {alpha} not between 0 and 1.")
+        if not len(self.curves):
+            raise Exception("Cannot call ArcLengthTable.point_from_proportion for a VMobject with no points")
+
+        target = alpha * self.cumulative[-1]
+        curve = np.minimum(np.searchsorted(self.cumulative[1:], target), len(self.curves) - 1)
+        length = self.lengths[curve]
+        residue = np.divide(target - self.cumulative[curve], length, out=np.zeros_like(target), where=length != 0)
+
+        points = self.evaluate(curve, residue)
+        return np.where((alpha == 1)[..., None], self.points[-1], points)
+
+
+def point_from_proportion(vmobject: VMobject, alpha):
+    """``vmobject.point_from_proportion(alpha)`` backed by an :class:`ArcLengthTable` kept on the mobject."""
+    table = getattr(vmobject, "arc_length_table", None)
+    if table is None or table.vmobject is not vmobject:
+        table = vmobject.arc_length_table = ArcLengthTable(vmobject)
+    return table.point_from_proportion(alpha)
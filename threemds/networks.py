@@ -0,0 +1,270 @@
+import numpy as np
+from manim import (DEFAULT_STROKE_WIDTH, RIGHT, UP, WHITE, YELLOW, Animation, AnimationGroup, Arrow, MathTex,
+                   Succession, UpdateFromAlphaFunc, VGroup, VMobject, color_gradient)
+
+from threemds.mobjects import MARKER, FastNumberLabel, PointCloudPlot
+
+
+def layer_centers(layer_sizes: list[int], node_radius: float = 1.0, node_buff: float = .25,
+                  layer_buff: float = 2.0) -> list[np.ndarray]:
+    """Node centers of each layer, stacked like ``arrange(DOWN)`` and spread like ``arrange(RIGHT)``."""
+    sizes = np.asarray(layer_sizes)
+    layer = np.repeat(np.arange(len(sizes)), sizes)
+    row = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+
+    centers = np.zeros((sizes.sum(), 3))
+    centers[:, 0] = (layer - (len(sizes) - 1) / 2) * (2 * node_radius + layer_buff)
+    centers[:, 1] = ((sizes[layer] - 1) / 2 - row) * (2 * node_radius + node_buff)
+    return np.split(centers, np.cumsum(sizes)[:-1])
+
+
+def edge_endpoints(left: np.ndarray, right: np.ndarray, node_radius: float) -> tuple[np.ndarray, np.ndarray]:
+    """Starts and ends of every edge between two layers, shaped (right nodes, left nodes, 3).
+
+    Edges leave the right side of a left node and point at the center of the right node,
+    ending on its circle.
+    """
+    starts = np.broadcast_to(left[None] + node_radius * RIGHT, (len(right), len(left), 3))
+    direction = right[:, None] - left[None]
+    ends = right[:, None] - node_radius * direction / np.linalg.norm(direction, axis=-1, keepdims=True)
+    return starts, ends
+
+
+def arrow_points(starts: np.ndarray, ends: np.ndarray, buff: float, tip_length: float) -> tuple[np.ndarray, np.ndarray]:
+    """Bezier points of straight arrow shafts and triangular tips, laid out like :class:`Arrow`."""
+    unit = (ends - starts) / np.linalg.norm(ends - starts, axis=1, keepdims=True)
+    starts, ends = starts + buff * unit, ends - buff * unit
+    tip = np.minimum(tip_length, .25 * np.linalg.norm(ends - starts, axis=1))[:, None]
+    base = ends - tip * unit
+    perp = np.stack([-unit[:, 1], unit[:, 0], np.zeros(len(unit))], axis=1)
+
+    t = np.linspace(0, 1, 4)[:, None]
+    shafts = starts[:, None] + t * (base - starts)[:, None]
+    corners = np.stack([ends, base + tip / 2 * perp, base - tip / 2 * perp, ends], axis=1)
+    tips = corners[:, :-1, None] + t * (corners[:, 1:] - corners[:, :-1])[:, :, None]
+    return shafts.reshape(-1, 3), tips.reshape(-1, 3)
+
+
+class NeuralNetworkDiagram(VGroup):
+    """Nodes and edges of a fully connected network, laid out with NumPy from its layer sizes.
+
+    Every layer's nodes are one VMobject and every pair of layers' edges is a handful of
+    VMobjects, so a 784-128-10 network builds in a fraction of a second. ``weights`` holds
+    one (next layer, layer) matrix per pair, like ``w_hidden``; with ``weight_colors``
+    and/or ``weight_widths`` the edges are binned by weight into ``n_bins`` styles.
+
+    Individual :class:`Arrow` and ``w_k`` labels are only built when asked for through
+    :meth:`arrows`, :meth:`labels` and :meth:`connections`, and follow the diagram's
+    current position and scale. ``centers`` overrides the layout to connect nodes that
+    were placed some other way.
+    """
+
+    def __init__(self, layer_sizes: list[int], weights: list[np.ndarray] | None = None,
+                 centers: list[np.ndarray] | None = None, node_radius: float = 1.0, node_buff: float = .25,
+                 layer_buff: float = 2.0, node_color=WHITE, edge_color=WHITE,
+                 edge_width: float = DEFAULT_STROKE_WIDTH, weight_colors=None, weight_widths=None,
+                 n_bins: int = 8, tip_length: float = .2, edge_buff: float = .05, label_scale: float = .6,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.layer_sizes = list(layer_sizes)
+        self.weights = weights
+        self.node_radius = node_radius
+        self.tip_length = tip_length
+        self.edge_buff = edge_buff
+        self.label_scale = label_scale
+        # labels are numbered w_1, w_2... across all layers, right node by right node
+        self.weight_offsets = np.cumsum([0, *np.multiply(self.layer_sizes[:-1], self.layer_sizes[1:])])
+        self._arrows, self._labels = {}, {}
+
+        if centers is None:
+            centers = layer_centers(self.layer_sizes, node_radius, node_buff, layer_buff)
+        centers = [np.asarray(c, dtype=float) for c in centers]
+
+        self.nodes = VGroup(*[
+            VMobject(stroke_color=node_color).set_points(
+                PointCloudPlot.marker_points(c, np.full(len(c), node_radius)))
+            for c in centers
+        ])
+
+        self.edges = VGroup()
+        for layer, (left, right) in enumerate(zip(centers, centers[1:])):
+            starts, ends = edge_endpoints(left, right, node_radius)
+            shafts, tips = arrow_points(starts.reshape(-1, 3), ends.reshape(-1, 3), edge_buff, tip_length)
+            shafts, tips = shafts.reshape(-1, 4, 3), tips.reshape(-1, 12, 3)
+
+            styles, bins = self.edge_styles(layer, edge_color, edge_width, weight_colors, weight_widths, n_bins)
+            pair = VGroup()
+            for (color, width), rows in zip(styles, bins):
+                pair.add(VMobject(stroke_color=color, stroke_width=width).set_points(shafts[rows].reshape(-1, 3)),
+                         VMobject(fill_color=color, fill_opacity=1, stroke_width=0).set_points(
+                             tips[rows].reshape(-1, 3)))
+            self.edges.add(pair)
+
+        self.add(self.edges, self.nodes)
+
+    def edge_styles(self, layer: int, edge_color, edge_width: float, weight_colors, weight_widths,
+                    n_bins: int) -> tuple[list[tuple], list[np.ndarray]]:
+        """(color, width) styles of a layer pair's edges, and the edge rows drawn in each."""
+        n = self.layer_sizes[layer] * self.layer_sizes[layer + 1]
+        if self.weights is None or (weight_colors is None and weight_widths is None):
+            return [(edge_color, edge_width)], [np.arange(n)]
+
+        w = np.asarray(self.weights[layer], dtype=float).reshape(-1)
+        scale = np.abs(w).max() or 1.0
+        color_bins = np.rint((w / scale + 1) / 2 * (n_bins - 1)).astype(int) if weight_colors else np.zeros(n, int)
+        width_bins = np.rint(np.abs(w) / scale * (n_bins - 1)).astype(int) if weight_widths else np.zeros(n, int)
+        colors = color_gradient(weight_colors, n_bins) if weight_colors else [edge_color] * n_bins
+        widths = np.linspace(*weight_widths, n_bins) if weight_widths else [edge_width] * n_bins
+
+        keys = color_bins * n_bins + width_bins
+        styles, bins = [], []
+        for key in np.unique(keys):
+            styles.append((colors[key // n_bins], widths[key % n_bins]))
+            bins.append(np.flatnonzero(keys == key))
+        return styles, bins
+
+    def get_centers(self, layer: int) -> np.ndarray:
+        """Current node centers of a layer, following any shift/scale applied to the diagram."""
+        points = self.nodes[layer].points
+        return points.reshape(-1, len(MARKER), 3).mean(axis=1)
+
+    def get_scale(self) -> float:
+        points = self.nodes[0].points
+        return np.linalg.norm(points[0] - points[:len(MARKER)].mean(axis=0)) / self.node_radius
+
+    def arrow(self, layer: int, j: int, i: int) -> Arrow:
+        """The edge from node ``i`` of ``layer`` to node ``j`` of the next layer, built on first use."""
+        key = (layer, j, i)
+        if key not in self._arrows:
+            scale = self.get_scale()
+            starts, ends = edge_endpoints(self.get_centers(layer)[[i]], self.get_centers(layer + 1)[[j]],
+                                          self.node_radius * scale)
+            self._arrows[key] = Arrow(start=starts[0, 0], end=ends[0, 0],
+                                      tip_length=self.tip_length * scale, buff=self.edge_buff * scale)
+        return self._arrows[key]
+
+    def label(self, layer: int, j: int, i: int) -> MathTex:
+        """The ``w_k`` label riding on :meth:`arrow`, built on first use."""
+        key = (layer, j, i)
+        if key not in self._labels:
+            arrow = self.arrow(layer, j, i)
+            k = self.weight_offsets[layer] + j * self.layer_sizes[layer] + i + 1
+            self._labels[key] = MathTex("w_{" + str(k) + "}") \
+                .scale(self.label_scale * self.get_scale()) \
+                .next_to(arrow.get_midpoint(), UP * .5) \
+                .rotate(arrow.get_angle(), about_point=arrow.get_midpoint())
+        return self._labels[key]
+
+    def _edges(self, layer: int, j: int | None):
+        rights = range(self.layer_sizes[layer + 1]) if j is None else [j]
+        return [(right, i) for right in rights for i in range(self.layer_sizes[layer])]
+
+    def arrows(self, layer: int, j: int | None = None) -> VGroup:
+        """Arrows into node ``j`` of the next layer, or between the whole layer pair."""
+        return VGroup(*[self.arrow(layer, j, i) for j, i in self._edges(layer, j)])
+
+    def labels(self, layer: int, j: int | None = None) -> VGroup:
+        return VGroup(*[self.label(layer, j, i) for j, i in self._edges(layer, j)])
+
+    def connections(self, layer: int) -> VGroup:
+        """One group per node of the next layer, holding an (arrow, label) group per incoming edge."""
+        return VGroup(*[
+            VGroup(*[VGroup(self.arrow(layer, j, i), self.label(layer, j, i)) for i in range(self.layer_sizes[layer])])
+            for j in range(self.layer_sizes[layer + 1])
+        ])
+
+
+def forward_pass(X: np.ndarray, weights: list[np.ndarray], biases: list[np.ndarray],
+                 activations: list) -> tuple[list[np.ndarray], list[np.ndarray]]:
+    """Pre-activations of every layer after the input, and activations of every layer including it.
+
+    ``X`` holds one input per column, so a whole batch goes through each layer in one matrix product.
+    """
+    zs, outputs = [], [np.asarray(X, dtype=float)]
+    for w, b, activation in zip(weights, biases, activations):
+        zs.append(w @ outputs[-1] + b)
+        outputs.append(activation(zs[-1]))
+    return zs, outputs
+
+
+class EdgePulses(Animation):
+    """Dots running along every edge of a layer pair at once, sized by the value they carry."""
+
+    def __init__(self, diagram: NeuralNetworkDiagram, layer: int, values: np.ndarray, radius: float = .08,
+                 color=YELLOW, **kwargs):
+        scale = diagram.get_scale()
+        starts, ends = edge_endpoints(diagram.get_centers(layer), diagram.get_centers(layer + 1),
+                                      diagram.node_radius * scale)
+        self.starts, self.ends = starts.reshape(-1, 3), ends.reshape(-1, 3)
+
+        # edges are ordered right node by right node, so the left node repeats along each row
+        values = np.abs(np.asarray(values, dtype=float))
+        values = values / (values.max() or 1.0)
+        self.radii = np.tile(radius * scale * (.3 + .7 * values), len(starts))
+
+        pulses = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+        super().__init__(pulses, introducer=True, remover=True, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        centers = self.starts + alpha * (self.ends - self.starts)
+        self.mobject.set_points(PointCloudPlot.marker_points(centers, self.radii))
+
+
+class ForwardPassAnimator:
+    """Animates inputs going through a :class:`NeuralNetworkDiagram`, straight from the NumPy model.
+
+    The activations of every layer for the whole batch come from one :func:`forward_pass`.
+    :attr:`labels` holds a :class:`FastNumberLabel` per node for layers of at most
+    ``max_labels`` nodes; add it to the scene once and every :meth:`animate_sample` updates
+    it in place, so a batch of any size plays without rebuilding anything.
+    """
+
+    def __init__(self, diagram: NeuralNetworkDiagram, X: np.ndarray, weights: list[np.ndarray],
+                 biases: list[np.ndarray], activations: list, num_decimal_places: int = 2,
+                 max_labels: int = 16, label_scale: float = .6, pulse_color=YELLOW):
+        self.diagram = diagram
+        self.zs, self.outputs = forward_pass(X, weights, biases, activations)
+        self.pulse_color = pulse_color
+
+        self.labels = VGroup()
+        for layer, values in enumerate(self.outputs):
+            layer_labels = VGroup()
+            if len(values) <= max_labels:
+                for value, center in zip(values[:, 0], diagram.get_centers(layer)):
+                    layer_labels.add(FastNumberLabel(value, num_decimal_places)
+                                     .scale(label_scale * diagram.get_scale())
+                                     .move_to(center))
+            self.labels.add(layer_labels)
+
+    @property
+    def batch_size(self) -> int:
+        return self.outputs[0].shape[1]
+
+    def set_sample(self, k: int):
+        """Show the values of input ``k`` without animating."""
+        for layer_labels, values in zip(self.labels, self.outputs):
+            for label, value in zip(layer_labels, values[:, k]):
+                label.set_value(value)
+        return self
+
+    def count_to(self, layer: int, k: int, **kwargs) -> AnimationGroup:
+        """Roll the labels of a layer over to their values for input ``k``."""
+        return AnimationGroup(*[
+            UpdateFromAlphaFunc(label, lambda m, a, start=label.get_value(), end=value:
+                                m.set_value(start + a * (end - start)))
+            for label, value in zip(self.labels[layer], self.outputs[layer][:, k])
+        ], **kwargs)
+
+    def propagate(self, layer: int, k: int, **kwargs) -> Succession:
+        """Pulses from ``layer`` to the next one, then the next layer's labels count to their values."""
+        animations = [EdgePulses(self.diagram, layer, self.outputs[layer][:, k], color=self.pulse_color)]
+        if len(self.labels[layer + 1]):
+            animations.append(self.count_to(layer + 1, k))
+        return Succession(*animations, **kwargs)
+
+    def animate_sample(self, k: int, **kwargs) -> Succession:
+        """The whole forward pass of input ``k``, starting with its input labels."""
+        animations = [self.count_to(0, k)] if len(self.labels[0]) else []
+        animations += [self.propagate(layer, k) for layer in range(len(self.outputs) - 1)]
+        return Succession(*animations, **kwargs)
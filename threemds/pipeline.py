@@ -0,0 +1,219 @@
+import os
+import queue
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from threemds.encoder import AsyncEncoder, ZeroCopyEncoder
+
+# how frames get from the rasterizer to ffmpeg: "pipe" is manim's own synchronous path
+OUTPUT = os.environ.get("THREEMDS_OUTPUT", "pipe")
+# frame buffers the camera draws into, its own array is one of them and each other one is 33 MB at 4K
+FRAME_QUEUE = int(os.environ.get("THREEMDS_FRAME_QUEUE", 2))
+# seconds between live memory reports, 0 for the summary only
+REPORT_INTERVAL = float(os.environ.get("THREEMDS_REPORT_INTERVAL", 10))
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process, the peak where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+class MemoryReport(threading.Thread):
+    """Prints RSS and queue depth every ``interval`` seconds while a scene renders."""
+
+    def __init__(self, name: str, depth, capacity: int, interval: float = REPORT_INTERVAL):
+        super().__init__(daemon=True)
+        self.name, self.depth, self.capacity, self.interval = name, depth, capacity, interval
+        self.max_depth = 0
+        self._done = threading.Event()
+
+    def line(self) -> str:
+        depth = self.depth()
+        self.max_depth = max(self.max_depth, depth)
+        return (f"{self.name}: RSS {rss_bytes() / 1024 ** 2:.0f} MB (peak {peak_rss_bytes() / 1024 ** 2:.0f} MB), "
+                f"queue {depth}/{self.capacity}")
+
+    def run(self):
+        while self.interval > 0 and not self._done.wait(self.interval):
+            print(self.line(), flush=True)
+
+    def stop(self) -> None:
+        self._done.set()
+
+
+class BoundedFramePipeline:
+    """Frames go to ffmpeg from a writer thread, rasterized straight into a bounded set of recycled buffers.
+
+    Manim copies every frame out of the camera (``get_frame``) and again into a bytes
+    object (``tobytes``) before the pipe write, so a 4K render holds the camera's array
+    plus two 33 MB copies per frame and the rasterizer waits on the encoder. Here every
+    ``update_frame`` points the camera's pixel array at one of ``depth`` buffers
+    allocated up front, the camera draws into it, and the writer thread hands that
+    buffer to the pipe as is. Waits are left to ``threemds.utils._encode_holds``. When
+    the encoder falls behind, the rasterizer blocks on a free buffer.
+
+    The camera's own array is the first buffer, so ``depth`` frames are resident in all,
+    two at the default against manim's three at its peak, and every frame of depth
+    above that adds 33 MB at 4K. The summary line reports how much the render raised
+    the process' peak RSS, to compare against ``THREEMDS_OUTPUT=pipe``.
+    """
+
+    def __init__(self, scene, depth: int = FRAME_QUEUE, report_interval: float = REPORT_INTERVAL):
+        self.scene = scene
+        self.renderer = scene.renderer
+        self.camera = self.renderer.camera
+        # one buffer for the camera to draw into while the other is written
+        self.depth = max(depth, 2)
+        # the camera's own array is the first buffer, so the render only adds depth - 1 frames
+        self.buffers = [self.camera.pixel_array] + [np.empty_like(self.camera.pixel_array)
+                                                    for _ in range(self.depth - 1)]
+        # frames of each buffer queued to the writer, and the buffer the camera is on
+        self.pending = [0] * self.depth
+        self.current = None
+        self.frames, self.written = queue.Queue(), queue.Queue()
+        self.thread = threading.Thread(target=self._write, daemon=True)
+        self.report = MemoryReport(type(scene).__name__, self.frames.qsize, self.depth, report_interval)
+        self.error = None
+        self.frames_written = 0
+        self.wait_seconds = 0.0
+        self.peak_rss_before = None
+        self._restore = []
+
+    def _write(self):
+        while (item := self.frames.get()) is not None:
+            stdin, index, num_frames = item
+            try:
+                if self.error is None:
+                    for _ in range(num_frames):
+                        stdin.write(self.buffers[index])
+                    self.frames_written += num_frames
+            except Exception as e:
+                self.error = e
+            finally:
+                self.written.put(index)
+                self.frames.task_done()
+        self.frames.task_done()
+
+    def _raise(self):
+        if self.error is not None:
+            raise self.error
+
+    def _buffer(self) -> int:
+        # the camera's buffer may still be frozen by a wait, so it is never handed out again right away
+        start = time.perf_counter()
+        while not (free := [i for i, n in enumerate(self.pending) if n == 0 and i != self.current]):
+            self.pending[self.written.get()] -= 1
+        self.wait_seconds += time.perf_counter() - start
+        return free[0]
+
+    def update_frame(self, scene, mobjects=None, include_submobjects: bool = True, ignore_skipping: bool = True,
+                     **kwargs):
+        if self.renderer.skip_animations and not ignore_skipping:
+            return
+        self.current = self._buffer()
+        # Camera.reset() and set_frame_to_background() write in place, so the frame is drawn into the buffer
+        self.camera.pixel_array = self.buffers[self.current]
+        self._update_frame(scene, mobjects, include_submobjects, ignore_skipping, **kwargs)
+
+    def add_frame(self, frame: np.ndarray, num_frames: int = 1):
+        # CairoRenderer.add_frame, queueing the frame once however often it repeats
+        dt = 1 / self.camera.frame_rate
+        if self.renderer.skip_animations:
+            return
+        self.renderer.time += num_frames * dt
+        self._raise()
+
+        if self.current is not None and frame is self.buffers[self.current]:
+            index = self.current
+        else:
+            index = self._buffer()
+            np.copyto(self.buffers[index], frame)
+        self.pending[index] += 1
+        self.frames.put((self.renderer.file_writer.writing_process.stdin, index, num_frames))
+        self.report.max_depth = max(self.report.max_depth, self.frames.qsize())
+
+    def render(self, scene, time, moving_mobjects):
+        # CairoRenderer.render, minus get_frame()'s copy of the camera array
+        self.renderer.update_frame(scene, moving_mobjects)
+        self.add_frame(self.camera.pixel_array)
+
+    def flush(self) -> None:
+        self.frames.join()
+        self._raise()
+
+    def install(self) -> "BoundedFramePipeline":
+        writer = self.renderer.file_writer
+        close_movie_pipe = writer.close_movie_pipe
+
+        def _close_movie_pipe():
+            # every queued frame of this partial movie goes in before its pipe closes
+            self.flush()
+            close_movie_pipe()
+
+        self._update_frame = self.renderer.update_frame
+        self._restore = [(self.renderer, "add_frame", self.renderer.add_frame),
+                         (self.renderer, "render", self.renderer.render),
+                         (self.renderer, "update_frame", self.renderer.update_frame),
+                         (writer, "close_movie_pipe", close_movie_pipe)]
+        self.renderer.add_frame, self.renderer.render = self.add_frame, self.render
+        self.renderer.update_frame = self.update_frame
+        writer.close_movie_pipe = _close_movie_pipe
+        self.current = 0
+        self.peak_rss_before = peak_rss_bytes()
+        self.thread.start()
+        self.report.start()
+        return self
+
+    def finish(self) -> None:
+        self.frames.put(None)
+        self.thread.join()
+        self.report.stop()
+        for owner, name, original in self._restore:
+            setattr(owner, name, original)
+        # the camera keeps the buffer it is on, its cached cairo contexts let go of the others
+        self.camera.pixel_array_to_cairo_context = {}
+        self.buffers = []
+        peak_delta = peak_rss_bytes() - self.peak_rss_before
+        print(f"{self.report.line()}, max queue {self.report.max_depth}, {self.frames_written} frames, "
+              f"{self.wait_seconds:.1f}s waiting on the encoder, peak RSS +{peak_delta / 1024 ** 2:.0f} MB "
+              f"during the render", flush=True)
+
+
+# output stages by THREEMDS_OUTPUT value
+STAGES = {"bounded": BoundedFramePipeline, "async": AsyncEncoder, "shm": ZeroCopyEncoder}
+
+
+@contextmanager
+def output_stage(scene, mode: str = OUTPUT):
+    """Run ``scene.render()`` inside this to swap in the output stage ``mode`` names.
+
+    Only movies of the Cairo renderer have a stage to swap, anything else (png output,
+    OpenGL, ``mode="pipe"``) keeps manim's own.
+    """
+    from manim import config
+    from manim.constants import RendererType
+    from manim.utils.file_ops import is_png_format, write_to_movie
+
+    if mode not in STAGES or config.renderer != RendererType.CAIRO or not write_to_movie() or is_png_format():
+        yield None
+        return
+
+    stage = STAGES[mode](scene).install()
+    try:
+        yield stage
+    finally:
+        stage.finish()
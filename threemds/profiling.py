@@ -0,0 +1,188 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# set THREEMDS_PROFILE to a directory to profile every scene threemds.utils renders into it
+PROFILE_DIR = os.environ.get("THREEMDS_PROFILE")
+PROFILE_ALLOCATIONS = os.environ.get("THREEMDS_PROFILE_ALLOCATIONS", "") not in ("", "0")
+
+
+class SceneProfiler:
+    """Wall time, call counts and allocations of every ``play``/``wait`` and updater of a scene.
+
+    Everything is tagged with the current ``next_section`` name and a source line: the
+    script line of each ``play`` (waits go through ``play``) and the definition of each
+    updater, with the class of the mobject it updates. ``allocations`` adds the net
+    bytes each call allocated, at tracemalloc's cost.
+
+    The speedscope export has one frame per section and play call. Updaters are summed
+    per play call and drawn as its children, since one event per updater call per frame
+    would not fit in a file; updaters running outside any play only show in the table.
+
+        profiler = SceneProfiler(scene).install()
+        scene.render()
+        profiler.finish()
+        print(profiler.table())
+        profiler.export_speedscope("scene.speedscope.json")
+    """
+
+    def __init__(self, scene, allocations: bool = False):
+        self.scene = scene
+        self.allocations = allocations
+        self.section = "(start)"
+        # (section, label) -> [calls, seconds, allocated bytes]
+        self.stats = {}
+        self.frames = []
+        self.events = []
+        self._frame_index = {}
+        self._labels = {}
+        self._play_updaters = None
+        self._start = None
+        self._end = None
+        self._restore = []
+        self._tracing = False
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._start
+
+    def _mark(self) -> tuple[float, int]:
+        return self._now(), tracemalloc.get_traced_memory()[0] if self.allocations else 0
+
+    def _record(self, label: str, start: float, allocated: int) -> float:
+        end, allocated_end = self._mark()
+        entry = self.stats.setdefault((self.section, label), [0, 0.0, 0])
+        entry[0] += 1
+        entry[1] += end - start
+        entry[2] += allocated_end - allocated
+        return end
+
+    def _frame(self, name: str, file: str | None = None, line: int | None = None) -> int:
+        if name not in self._frame_index:
+            self._frame_index[name] = len(self.frames)
+            self.frames.append({k: v for k, v in (("name", name), ("file", file), ("line", line)) if v is not None})
+        return self._frame_index[name]
+
+    def _updater_label(self, mob, updater) -> str:
+        code = getattr(updater, "__code__", None) or getattr(getattr(updater, "__func__", None), "__code__", None)
+        key = (type(mob), code or updater)
+        if key not in self._labels:
+            where = f"{Path(code.co_filename).name}:{code.co_firstlineno}" if code else repr(updater)
+            self._labels[key] = f"{type(mob).__name__} updater {where}"
+        return self._labels[key]
+
+    def _caller(self) -> tuple[str | None, int | None]:
+        """The first frame outside manim and this module, i.e. the script calling ``play``."""
+        import manim
+
+        skip = (str(Path(manim.__file__).parent), __file__)
+        frame = sys._getframe(2)
+        while frame is not None and frame.f_code.co_filename.startswith(skip):
+            frame = frame.f_back
+        return (frame.f_code.co_filename, frame.f_lineno) if frame else (None, None)
+
+    def install(self) -> "SceneProfiler":
+        from manim import Mobject, Wait
+        from manim.utils.simple_functions import get_parameters
+
+        profiler, scene = self, self.scene
+        play, next_section, update = scene.play, scene.next_section, Mobject.update
+
+        def _play(*args, **kwargs):
+            file, line = profiler._caller()
+            names = [type(a).__name__.lstrip("_").replace("AnimationBuilder", "animate") for a in args]
+            kind = "wait" if args and all(isinstance(a, Wait) for a in args) else "play"
+            label = f"{kind} {Path(file).name if file else '?'}:{line} {', '.join(names)}".rstrip()
+
+            start, allocated = profiler._mark()
+            profiler._play_updaters = {}
+            try:
+                return play(*args, **kwargs)
+            finally:
+                updaters, profiler._play_updaters = profiler._play_updaters, None
+                end = profiler._record(label, start, allocated)
+                frame = profiler._frame(label, file, line)
+                profiler.events.append({"type": "O", "frame": frame, "at": start})
+                at = start
+                for updater_label, seconds in updaters.items():
+                    child = profiler._frame(updater_label)
+                    profiler.events.append({"type": "O", "frame": child, "at": at})
+                    at += seconds
+                    profiler.events.append({"type": "C", "frame": child, "at": at})
+                profiler.events.append({"type": "C", "frame": frame, "at": end})
+
+        def _next_section(name: str = "unnamed", *args, **kwargs):
+            profiler._close_section()
+            profiler._open_section(name)
+            return next_section(name, *args, **kwargs)
+
+        def _update(mob, dt: float = 0, recursive: bool = True):
+            # Mobject.update with every updater call timed
+            if mob.updating_suspended:
+                return mob
+            for updater in mob.updaters:
+                start, allocated = profiler._mark()
+                if "dt" in get_parameters(updater):
+                    updater(mob, dt)
+                else:
+                    updater(mob)
+                label = profiler._updater_label(mob, updater)
+                seconds = profiler._record(label, start, allocated) - start
+                if profiler._play_updaters is not None:
+                    profiler._play_updaters[label] = profiler._play_updaters.get(label, 0.0) + seconds
+            if recursive:
+                for submob in mob.submobjects:
+                    submob.update(dt, recursive)
+            return mob
+
+        scene.play, scene.next_section, Mobject.update = _play, _next_section, _update
+        self._restore = [(scene, "play", play), (scene, "next_section", next_section), (Mobject, "update", update)]
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self._start = time.perf_counter()
+        self._open_section(self.section)
+        return self
+
+    def _open_section(self, name: str) -> None:
+        self.section = name
+        self.events.append({"type": "O", "frame": self._frame(f"section {name}"), "at": self._now()})
+
+    def _close_section(self) -> None:
+        self.events.append({"type": "C", "frame": self._frame(f"section {self.section}"), "at": self._now()})
+
+    def finish(self) -> None:
+        """Close the last section and undo the patches."""
+        self._close_section()
+        self._end = self._now()
+        for owner, name, original in reversed(self._restore):
+            setattr(owner, name, original)
+        self._restore = []
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def table(self, n: int = 20) -> str:
+        """The ``n`` entries with the most wall time, updaters included in the plays they ran in."""
+        rows = sorted(self.stats.items(), key=lambda item: -item[1][1])[:n]
+        lines = [f"{'seconds':>9} {'calls':>8} {'alloc MB':>9}  {'section':<24} where"]
+        for (section, label), (calls, seconds, allocated) in rows:
+            lines.append(f"{seconds:9.3f} {calls:8d} {allocated / 1024 ** 2:9.1f}  {section[:24]:<24} {label}")
+        return "\n".join(lines)
+
+    def export_speedscope(self, path: str | Path) -> None:
+        """Write the timeline as a speedscope file, open it at https://www.speedscope.app."""
+        name = type(self.scene).__name__
+        profile = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "threemds.profiling",
+            "shared": {"frames": self.frames},
+            "profiles": [{"type": "evented", "name": name, "unit": "seconds",
+                          "startValue": 0, "endValue": self._end if self._end is not None else self._now(),
+                          "events": self.events}],
+        }
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(profile))
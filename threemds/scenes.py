@@ -0,0 +1,166 @@
+import hashlib
+import inspect
+from pathlib import Path
+
+from manim import *
+
+from threemds.utils import _fingerprint_config, _fingerprint_source, _value_bytes
+
+
+class CachedClip:
+    """Mixin for shared scenes whose movie depends only on their source here, the render config and :meth:`clip_files`.
+
+    :func:`threemds.utils.scene_key` keys them by :meth:`clip_key`, which leaves out the
+    episode script, so every episode subclassing one reuses the movie the first one
+    rendered at the same quality, frame size, frame rate and config. Subclasses may set
+    class attributes, those that change the movie are listed in ``clip_attributes``.
+    """
+    clip_attributes = ()
+
+    @classmethod
+    def clip_files(cls) -> list[str]:
+        """Files the scene reads, hashed by content into its clip key."""
+        return []
+
+    @classmethod
+    def clip_key(cls) -> tuple[str, list[str]] | None:
+        """Hash of the clip and the files that must stay unchanged, in the form of ``scene_key``.
+
+        None when a subclass outside this module defines methods, such a scene gets an
+        ordinary scene key.
+        """
+        import manim
+
+        shared = [c for c in cls.__mro__ if c.__module__ == __name__]
+        for c in cls.__mro__[:cls.__mro__.index(shared[0])]:
+            if any(inspect.isfunction(v) or isinstance(v, (classmethod, staticmethod, property))
+                   for name, v in vars(c).items() if not name.startswith("__")):
+                return None
+
+        hasher = hashlib.sha256()
+        seen, inputs = set(), set()
+        for c in shared:
+            if not _fingerprint_source(c, hasher, seen, inputs):
+                return None
+        hasher.update(manim.__version__.encode())
+        if not _fingerprint_config(hasher):
+            return None
+        for name in cls.clip_attributes:
+            data = _value_bytes(getattr(cls, name))
+            if data is None:
+                return None
+            hasher.update(name.encode() + b"=" + data)
+        for file in cls.clip_files():
+            hasher.update(hashlib.sha256(Path(file).read_bytes()).digest())
+            inputs.add(file)
+        return hasher.hexdigest(), sorted(str(Path(f).resolve()) for f in inputs)
+
+
+class LogoScene(CachedClip, Scene):
+    """The animated 3-Minute Data Science teacup logo."""
+
+    def construct(self):
+        circle = Circle(1.0, color=BLUE)
+        rectangle = Rectangle(height=1.0, width=2.0, color=BLUE).move_to(circle, UP)
+
+        handle = RoundedRectangle(corner_radius=.5, height=1.5, width=2.0, color=BLUE) \
+            .move_to(circle).shift(LEFT * .8)
+
+        handle_inner = Difference(handle, handle.copy().scale(.8), color=BLUE, fill_opacity=0.0)
+
+        cup = VGroup(circle, rectangle, handle_inner)
+
+        self.play(
+            Create(cup)
+        )
+
+        self.play(
+            cup.animate.set_fill(BLUE, opacity=1)
+        )
+
+        # create sin wave steam
+
+        def get_sine_wave(dx=0):
+            return FunctionGraph(
+                lambda x: np.sin((x + dx)),
+                x_range=[-3, 3]
+            )
+
+        sine_function = get_sine_wave()
+        d_theta = ValueTracker(0)
+
+        def update_wave(func):
+            func.become(
+                get_sine_wave(dx=d_theta.get_value())
+            )
+            return func
+
+        sine_function.add_updater(update_wave)
+
+        self.play(Create(sine_function))
+        self.play(d_theta.animate.increment_value(4 * PI), run_time=2)
+
+        # create steam functions
+        steam_functions = []
+        steam_waves = VGroup()
+        for i in range(3):
+            steam_function = get_sine_wave() \
+                .rotate(PI / 2.0) \
+                .scale(.2) \
+                .next_to(cup, UP) \
+                .shift([i * .5, 0, 0])
+
+            steam_waves.add(steam_function)
+
+            d_theta = ValueTracker(0)
+
+            def update_wave(func, d=d_theta, i=i):
+                func.become(
+                    get_sine_wave(dx=d.get_value()) \
+                        .rotate(PI / 2.0) \
+                        .scale(.2) \
+                        .next_to(cup, UP) \
+                        .shift([i * .5, 0, 0])
+                )
+                return func
+
+            steam_function.add_updater(update_wave)
+
+            steam_functions += d_theta
+
+            self.play(Create(steam_function), run_time=.3)
+
+        text = Text("3-Minute Data Science").scale(.8).shift(DOWN * 1.5)
+        self.play(Write(text), run_time=.5)
+        #mobj_to_svg(VGroup(cup, steam_waves, sine_function), 'logo.svg', h_padding=1)
+        self.play(*(d.animate.increment_value(4 * PI) for d in steam_functions), run_time=8, rate_func=linear)
+        self.wait()
+
+
+class ClosingCard(CachedClip, Scene):
+    """The closing promo card. Episodes subclass it to point ``book_files`` at their own images."""
+    book_files = ()
+    book_scale = .9
+    clip_attributes = ("book_scale",)
+
+    @classmethod
+    def clip_files(cls) -> list[str]:
+        return list(cls.book_files)
+
+    def construct(self):
+        title = Text("Get 10-Day Free Access") \
+            .set_color(BLUE).to_edge(UL)
+
+        books = Group(*[ImageMobject(f) for f in self.book_files]) \
+            .scale(self.book_scale).arrange(RIGHT, buff=.8).next_to(title, DOWN, buff=.8, aligned_edge=LEFT)
+
+        source_code = Tex("My books, live trainings, courses and more!", color=BLUE) \
+            .next_to(books, DOWN, aligned_edge=LEFT, buff=1)
+
+        email = Text(r"See link in the description") \
+            .scale(.5) \
+            .next_to(source_code, DOWN, aligned_edge=LEFT)
+
+        self.play(*[FadeIn(mobj) for mobj in (title, books, source_code, email)])
+
+        self.wait(29)
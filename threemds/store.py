@@ -0,0 +1,180 @@
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+# one copy of every asset, named by the sha256 of its content
+STORE_DIR = Path(os.environ.get("THREEMDS_CACHE_DIR", Path.home() / ".cache" / "threemds")) / "store"
+INDEX_FILE = STORE_DIR / "index.json"
+
+# ioctl of Linux copy-on-write clones (btrfs, xfs), see ioctl_ficlone(2)
+FICLONE = 0x40049409
+
+# path -> (size, mtime_ns, digest) of files already hashed, so unchanged files are not read again
+_index = None
+
+
+def _load_index() -> dict:
+    global _index
+    if _index is None:
+        try:
+            _index = json.loads(INDEX_FILE.read_text())
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def _save_index() -> None:
+    global _index
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(INDEX_FILE.with_name(f"{INDEX_FILE.name}.lock"), "w") as lock:
+        # render workers save concurrently, merge what the others saved since this one loaded it
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            saved = json.loads(INDEX_FILE.read_text())
+        except (OSError, ValueError):
+            saved = {}
+        _index = {**saved, **_load_index()}
+        tmp = INDEX_FILE.with_name(f"{INDEX_FILE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(_index))
+        os.replace(tmp, INDEX_FILE)
+
+
+def digest(path: str | Path) -> str:
+    """sha256 of a file, read only when its size or mtime changed since it was last hashed."""
+    path = Path(path).resolve()
+    stat = path.stat()
+    index = _load_index()
+    entry = index.get(str(path))
+    if entry and entry[:2] == [stat.st_size, stat.st_mtime_ns]:
+        return entry[2]
+
+    h = hashlib.sha256()
+    with open(path, "rb") as fp:
+        while chunk := fp.read(1024 ** 2):
+            h.update(chunk)
+    index[str(path)] = [stat.st_size, stat.st_mtime_ns, h.hexdigest()]
+    return h.hexdigest()
+
+
+def reflink(src: Path, dst: Path) -> None:
+    """Copy-on-write clone of ``src``, raises OSError where the filesystem has none."""
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+
+
+def _materialize(src: Path, dst: Path, hardlink: bool = False) -> bool:
+    """Put ``src`` at ``dst`` without duplicating its blocks, False if the filesystem cannot."""
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+    try:
+        if hardlink:
+            os.link(src, tmp)
+        else:
+            reflink(src, tmp)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return False
+    os.replace(tmp, dst)
+    return True
+
+
+def object_path(key: str, suffix: str = "") -> Path:
+    return STORE_DIR / "objects" / key[:2] / f"{key}{suffix.lower()}"
+
+
+def put(path: str | Path) -> Path:
+    """Add a file to the store, returning the store's copy of its content.
+
+    Objects are cloned or copied in, never hardlinked, so rewriting the original in
+    place (ffmpeg -y does) cannot change what the store holds.
+    """
+    path = Path(path)
+    obj = object_path(digest(path), path.suffix)
+    if not obj.exists():
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        if not _materialize(path, obj):
+            tmp = obj.with_name(f"{obj.name}.{os.getpid()}.tmp")
+            shutil.copyfile(path, tmp)
+            os.replace(tmp, obj)
+        _save_index()
+    return obj
+
+
+def _canonical(key: str, suffix: str) -> Path | None:
+    """The first indexed of the files that still hold content ``key``."""
+    for indexed in [p for p, entry in _load_index().items() if entry[2] == key]:
+        indexed = Path(indexed)
+        if indexed.suffix.lower() == suffix.lower() and indexed.is_file() and digest(indexed) == key:
+            return indexed
+    return None
+
+
+def resolve(path: str | Path) -> str:
+    """One path for every copy of a resource, so identical assets of every episode are one file.
+
+    Caches keyed by path, like :func:`threemds.assets.load_svg` or manim's image
+    loading, then hit across episodes too. The path is the store's object where the
+    filesystem can reflink it in. Elsewhere nothing is copied, and the first indexed
+    file with the same content stands in for all of them. A missing file is returned
+    unchanged so the usual error surfaces where it is opened.
+    """
+    path = Path(path)
+    if not path.is_file():
+        return str(path)
+    key = digest(path)
+    obj = object_path(key, path.suffix)
+    if not obj.exists():
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        if not _materialize(path, obj):
+            _save_index()
+            return str(_canonical(key, path.suffix) or path.resolve())
+        _save_index()
+    return str(obj)
+
+
+def dedupe(dirs: list[str | Path], hardlink: bool = False, dry_run: bool = False) -> int:
+    """Replace duplicate files under ``dirs`` by clones of the first copy found, returning bytes saved.
+
+    Clones are copy-on-write, so every file stays independently writable. With
+    ``hardlink`` duplicates become hardlinks instead, which works on any filesystem but
+    means writing one in place writes all of them: use it for finished renders only.
+    """
+    saved = 0
+    seen = {}
+    store = STORE_DIR.resolve()
+    for d in dirs:
+        for f in sorted(Path(d).rglob("*")):
+            if not f.is_file() or f.is_symlink() or f.stat().st_size == 0 or f.resolve().is_relative_to(store):
+                continue
+            key = digest(f)
+            if key not in seen:
+                seen[key] = f
+                continue
+            first = seen[key]
+            if os.path.samefile(first, f):
+                continue
+            size = f.stat().st_size
+            if dry_run:
+                print(f"duplicate {f} of {first}")
+                saved += size
+            elif _materialize(first, f, hardlink):
+                print(f"deduped {f}")
+                saved += size
+            else:
+                print(f"skipped {f}, {'hardlinks' if hardlink else 'reflinks'} not supported there")
+    _save_index()
+    return saved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deduplicate asset and render folders by content.")
+    parser.add_argument("dirs", nargs="+")
+    parser.add_argument("--hardlink", action="store_true",
+                        help="hardlink duplicates where reflinks are not supported (shared writes!)")
+    parser.add_argument("--dry-run", action="store_true", help="only report duplicates")
+    args = parser.parse_args()
+    saved = dedupe(args.dirs, args.hardlink, args.dry_run)
+    print(f"{saved / 1024 ** 2:.1f} MB {'duplicated' if args.dry_run else 'saved'}")
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+
+# point THREEMDS_CACHE_DIR at a shared directory to reuse compiled LaTeX across machines
+CACHE_FILE = Path(os.environ.get("THREEMDS_CACHE_DIR", Path.home() / ".cache" / "threemds")) / "tex.sqlite"
+MAX_BYTES = int(float(os.environ.get("THREEMDS_TEX_CACHE_MB", 256)) * 1024 ** 2)
+
+
+class TexCache:
+    """Compiled SVGs in one SQLite file, keyed by the hash of the full LaTeX source.
+
+    The source already contains the template preamble (fonts, packages) and the
+    environment, so the key is (tex code, compiler, output format). Writers in other
+    processes are serialized by SQLite's own locking, and the least recently used
+    entries are evicted once the compressed SVGs exceed ``max_bytes``.
+    """
+
+    def __init__(self, path: str | Path = CACHE_FILE, max_bytes: int = MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # connections must not cross a fork, so every worker process opens its own
+        if self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS svg ("
+                                     "key TEXT PRIMARY KEY, data BLOB NOT NULL, "
+                                     "size INTEGER NOT NULL, last_used REAL NOT NULL)")
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def key(tex_code: str, tex_compiler: str, output_format: str) -> str:
+        return hashlib.sha256(json.dumps([tex_code, tex_compiler, output_format]).encode()).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        row = self.connection.execute("SELECT data FROM svg WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.connection.execute("UPDATE svg SET last_used = ? WHERE key = ?", (time.time(), key))
+        return zlib.decompress(row[0])
+
+    def put(self, key: str, svg: bytes) -> None:
+        data = zlib.compress(svg)
+        with self.connection:
+            self.connection.execute("BEGIN IMMEDIATE")
+            self.connection.execute("INSERT OR REPLACE INTO svg VALUES (?, ?, ?, ?)",
+                                    (key, data, len(data), time.time()))
+            self.evict()
+
+    def evict(self) -> None:
+        """Drop least recently used entries beyond ``max_bytes``."""
+        self.connection.execute(
+            "DELETE FROM svg WHERE key IN (SELECT key FROM "
+            "(SELECT key, SUM(size) OVER (ORDER BY last_used DESC) AS total FROM svg) WHERE total > ?)",
+            (self.max_bytes,))
+
+
+_cache = TexCache()
+# svg files already resolved by this process, keyed like the cache
+_svg_files = {}
+
+
+def tex_to_svg_file(expression: str, environment: str | None = None, tex_template=None) -> Path:
+    """Drop-in for :func:`manim.utils.tex_file_writing.tex_to_svg_file` that checks the shared cache first."""
+    from manim import config
+    from manim.utils import tex_file_writing
+
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    if environment is not None:
+        tex_code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+    else:
+        tex_code = tex_template.get_texcode_for_expression(expression)
+
+    key = _cache.key(tex_code, tex_template.tex_compiler, tex_template.output_format)
+    if key in _svg_files and _svg_files[key].exists():
+        return _svg_files[key]
+
+    # same name manim gives it, so manim's own per-project cache keeps working too
+    svg_file = config.get_dir("tex_dir") / f"{tex_file_writing.tex_hash(tex_code)}.svg"
+    svg = _cache.get(key)
+    if svg is None:
+        svg_file = Path(tex_file_writing.tex_to_svg_file(expression, environment, tex_template))
+        _cache.put(key, svg_file.read_bytes())
+    elif not svg_file.exists():
+        svg_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = svg_file.with_name(f"{svg_file.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(svg)
+        os.replace(tmp, svg_file)
+
+    _svg_files[key] = svg_file
+    return svg_file
+
+
+def install() -> None:
+    """Route every Tex/MathTex (and so DecimalNumber, Integer...) through the shared cache."""
+    from manim.mobject.text import tex_mobject
+
+    tex_mobject.tex_to_svg_file = tex_to_svg_file
@@ -0,0 +1,115 @@
+from collections import Counter
+from contextlib import contextmanager
+
+import numpy as np
+
+# updater calls of this process that did or skipped their work, reset per scene by threemds.utils
+update_counts = Counter()
+
+
+# mobjects with more points than this are too costly to compare every frame
+SMALL_MOBJECT_POINTS = 1024
+
+
+def dependency_state(dependencies) -> tuple:
+    """Snapshot of what a derived value or tracked mobject was last computed from.
+
+    ValueTrackers, :class:`Derived` values and anything else with ``get_value()``
+    contribute their value. :class:`~threemds.mobjects.Tracked` mobjects contribute
+    their ``version``, which counts their recomputes, and axes the points their origin
+    and unit coordinates map to, so moving or scaling axes counts as a change. Any
+    other mobject contributes its points, which only small ones like a :class:`Dot`
+    can afford every frame; a larger one raises, depend on its axes instead.
+    """
+    state = []
+    for dependency in dependencies:
+        # looked up on the class, Mobject.__getattr__ makes up a getter for any get_* name
+        kind = type(dependency)
+        if hasattr(kind, "get_value"):
+            state.append(np.asarray(dependency.get_value(), dtype=float).tobytes())
+        elif hasattr(dependency, "version"):
+            state.append(dependency.version)
+        elif hasattr(kind, "coords_to_point"):
+            unit = np.vstack([np.zeros(dependency.dimension), np.eye(dependency.dimension)])
+            state.append(np.asarray(dependency.coords_to_point(*unit.T), dtype=float).tobytes())
+        else:
+            points = dependency.get_all_points()
+            if len(points) > SMALL_MOBJECT_POINTS:
+                raise ValueError(f"{kind.__name__} has {len(points)} points, too many to compare every frame, "
+                                 "depend on its axes or on the trackers that move it instead")
+            state.append(points.tobytes())
+    return tuple(state)
+
+
+class Derived:
+    """A value computed from ValueTrackers, shared by every updater that reads it.
+
+    ``function`` takes no arguments and is called again only when the state of one of
+    the declared ``dependencies`` changed since the last call, so within a frame it
+    runs at most once however many updaters ask, and not at all while the trackers sit
+    still. Anything ``function`` reads that can change has to be declared.
+
+        x = ValueTracker(0)
+        cdf_value = Derived(lambda: cdf.f(x.get_value()), x)
+        cdf_point = Derived(lambda: cdf.x2p(x.get_value()), x, cdf.axes)
+    """
+
+    def __init__(self, function, *dependencies):
+        self.function = function
+        self.dependencies = dependencies
+        self.state = None
+        self.value = None
+
+    def get_value(self):
+        state = dependency_state(self.dependencies)
+        if state != self.state:
+            self.value = self.function()
+            self.state = state
+        return self.value
+
+
+@contextmanager
+def recording_reads():
+    """Collect every ValueTracker whose ``get_value()`` is called inside the block, in order."""
+    from manim import ValueTracker
+
+    reads = {}
+    get_value = ValueTracker.get_value
+
+    def _get_value(self):
+        reads.setdefault(id(self), self)
+        return get_value(self)
+
+    ValueTracker.get_value = _get_value
+    try:
+        yield reads.values()
+    finally:
+        ValueTracker.get_value = get_value
+
+
+def redraw(function, watch=()):
+    """``always_redraw`` that only rebuilds on frames where something the function reads changed.
+
+    The ValueTrackers ``function`` reads are recorded on every build, so a branch that
+    starts reading another tracker is picked up. Mobjects it reads positions from are
+    invisible to that and go in ``watch``. When it reads nothing at all, it rebuilds
+    every frame like ``always_redraw``.
+    """
+    with recording_reads() as reads:
+        mob = function()
+    dependencies = (*reads, *watch)
+    state = dependency_state(dependencies)
+
+    def update(m):
+        nonlocal dependencies, state
+        if dependencies and dependency_state(dependencies) == state:
+            update_counts["skipped"] += 1
+            return
+        update_counts["executed"] += 1
+        with recording_reads() as reads:
+            m.become(function())
+        dependencies = (*reads, *watch)
+        state = dependency_state(dependencies)
+
+    mob.add_updater(update)
+    return mob
@@ -0,0 +1,793 @@
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+
+from threemds.store import STORE_DIR, _materialize
+
+# finished scene movies by scene key, set THREEMDS_SCENE_CACHE=0 to always render
+SCENE_CACHE_DIR = Path(os.environ.get("THREEMDS_CACHE_DIR", Path.home() / ".cache" / "threemds")) / "scenes"
+SCENE_CACHE = os.environ.get("THREEMDS_SCENE_CACHE", "1") not in ("", "0")
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# the -q flags of the manim CLI
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+# frame sizes of proxy previews, THREEMDS_PROXY=<name> renders every scene as a proxy
+PROXIES = {
+    "270p": (480, 270),
+    "360p": (640, 360),
+    "480p": (854, 480),
+}
+PROXY = os.environ.get("THREEMDS_PROXY") or None
+# x264 preset of proxy movies
+PROXY_PRESET = "ultrafast"
+
+
+@dataclass
+class RenderResult:
+    scene_name: str
+    exit_status: int
+    seconds: float
+    output_file: str | None = None
+    error: str | None = None
+    # updater calls of Tracked mobjects and threemds.trackers.redraw, see update_counts
+    updates_executed: int = 0
+    updates_skipped: int = 0
+    # scene key and files the render read, for caching a movie assembled from several renders
+    cache_key: str | None = None
+    inputs: list[str] = field(default_factory=list)
+    # how the timing differs from the scene's proxy render, see check_timing
+    timing_mismatches: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_status == 0
+
+
+# scripts loaded by this worker process, keyed by path
+_modules = {}
+
+
+def load_script(file: str):
+    """Import a scene script by path, once per process."""
+    file = str(Path(file).resolve())
+    if file not in _modules:
+        spec = importlib.util.spec_from_file_location(Path(file).stem, file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        _modules[file] = module
+    return _modules[file]
+
+
+def scene_config(file: str, q: str | None = None, **config_overrides) -> dict:
+    """Config overrides equivalent to ``manim -q<q> <file>`` plus any extras."""
+    overrides = {"input_file": str(Path(file).resolve())}
+    if q:
+        overrides["quality"] = QUALITIES[q]
+    overrides.update(config_overrides)
+    return overrides
+
+
+def proxy_config(overrides: dict, proxy: str) -> dict:
+    """``overrides`` with the frame size of proxy profile ``proxy``.
+
+    The frame rate stays the final render's, so every play spans the same frames and
+    the proxy's timing is the final timing. Proxies get a video directory of their own,
+    since manim names the default one by frame height and rate only and a 480p proxy
+    of a ``-ql`` render would overwrite the final movie.
+    """
+    from manim.constants import QUALITIES as MANIM_QUALITIES
+
+    overrides = dict(overrides)
+    if "quality" in overrides:
+        # manim applies quality after the frame size and it would win, keep only its frame rate
+        overrides["frame_rate"] = MANIM_QUALITIES[overrides.pop("quality")]["frame_rate"]
+    overrides["pixel_width"], overrides["pixel_height"] = PROXIES[proxy]
+    overrides["video_dir"] = "{media_dir}/videos/{module_name}/proxies/{quality}"
+    return overrides
+
+
+def _in_repo(file) -> bool:
+    return bool(file) and Path(file).resolve().is_relative_to(REPO_ROOT)
+
+
+def _value_bytes(value) -> bytes | None:
+    """Stand-in bytes for module level data, None for values without a stable representation."""
+    import numpy as np
+
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        return repr((value.shape, str(value.dtype))).encode() + value.tobytes()
+    if hasattr(value, "to_csv"):
+        return value.to_csv().encode()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_value_bytes(v) for v in (sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value)]
+        return None if None in items else b"[" + b",".join(items) + b"]"
+    if isinstance(value, dict):
+        items = [_value_bytes(item) for item in value.items()]
+        return None if None in items else b"{" + b",".join(items) + b"}"
+    text = repr(value)
+    # numpy summarizes large arrays and default reprs hold addresses, neither identifies the value
+    return None if " at 0x" in text or "..." in text else text.encode()
+
+
+def _fingerprint_source(obj, hasher, seen: set, files: set) -> bool:
+    """Hash the AST of a class or function and, recursively, the globals it names.
+
+    Comments and formatting do not change the AST, so they do not change the key.
+    Classes and functions of the repo are followed into the module that defines them,
+    and a repo module named as ``store.resolve`` contributes only that attribute; one
+    used any other way goes into ``files`` whole. Library names are skipped. False if
+    something named cannot be fingerprinted, in which case the scene is not cached.
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(obj)))
+        hasher.update(ast.dump(tree).encode())
+    except (OSError, TypeError, SyntaxError):
+        # a lambda in the middle of a statement has no source of its own
+        if not hasattr(obj, "__code__"):
+            return False
+        code = obj.__code__
+        hasher.update(code.co_code + repr((code.co_consts, code.co_names)).encode())
+        tree = ast.Module(body=[ast.Expr(ast.Name(name)) for name in code.co_names], type_ignores=[])
+
+    module = sys.modules.get(obj.__module__)
+    if module is None:
+        return True
+    attributes, qualified = {}, set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            attributes.setdefault(node.value.id, set()).add(node.attr)
+            qualified.add(id(node.value))
+    bare = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name) and id(node) not in qualified}
+
+    for name in sorted(bare | set(attributes)):
+        value = vars(module).get(name)
+        if inspect.ismodule(value):
+            if not _in_repo(getattr(value, "__file__", None)):
+                continue
+            hasher.update(name.encode())
+            if name in bare:
+                files.add(value.__file__)
+            elif not all(_fingerprint_global(value, attribute, hasher, seen, files)
+                         for attribute in sorted(attributes[name])):
+                return False
+        elif not _fingerprint_global(module, name, hasher, seen, files):
+            return False
+    return True
+
+
+def _fingerprint_global(module, name: str, hasher, seen: set, files: set) -> bool:
+    """Hash one global of ``module`` for :func:`_fingerprint_source`."""
+    if name not in vars(module) or (module.__name__, name) in seen:
+        return True
+    seen.add((module.__name__, name))
+    value = vars(module)[name]
+    hasher.update(name.encode())
+
+    if inspect.ismodule(value):
+        if _in_repo(getattr(value, "__file__", None)):
+            files.add(value.__file__)
+        return True
+    if inspect.isclass(value) or inspect.isfunction(value):
+        if _in_repo(getattr(sys.modules.get(value.__module__), "__file__", None)):
+            return _fingerprint_source(value, hasher, seen, files)
+        return True
+    data = _value_bytes(value)
+    if data is not None:
+        hasher.update(data)
+        return True
+    # an instance of one of our own classes, anything else is a library constant
+    return not _in_repo(getattr(sys.modules.get(type(value).__module__), "__file__", None))
+
+
+# config that only changes where and how a render is shown or logged, not the movie
+_UNKEYED_CONFIG = {
+    "assets_dir", "custom_folders", "disable_caching", "disable_caching_warning", "enable_gui", "ffmpeg_loglevel",
+    "flush_cache", "force_window", "fullscreen", "gui_location", "images_dir", "input_file", "log_dir",
+    "log_to_file", "max_files_cached", "media_dir", "media_embed", "media_width", "notify_outdated_version",
+    "output_file", "partial_movie_dir", "preview", "progress_bar", "scene_names", "sections_dir",
+    "show_in_file_browser", "tex_dir", "text_dir", "verbosity", "video_dir", "window_monitor", "window_position",
+    "window_size",
+}
+
+
+def _is_main_block(node: ast.stmt) -> bool:
+    return isinstance(node, ast.If) and isinstance(node.test, ast.Compare) \
+        and isinstance(node.test.left, ast.Name) and node.test.left.id == "__name__"
+
+
+def _fingerprint_script(script: str, hasher) -> None:
+    """Hash the module level statements of a script that change state outside the script.
+
+    Those run at import and can change every scene, e.g. ``config.frame_width = 9``
+    or ``Text.set_default(font=...)``. Imports, definitions and plain ``name = ...``
+    assignments only count when a scene names them.
+    """
+    tree = ast.parse(Path(script).read_text())
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            targets = [node.target]
+        elif isinstance(node, ast.Expr) and not isinstance(node.value, ast.Constant):
+            targets = [node.value]
+        else:
+            continue
+        if not all(isinstance(target, ast.Name) for target in targets):
+            hasher.update(ast.dump(node).encode())
+
+
+def _fingerprint_config(hasher) -> bool:
+    """Hash every manim config option that changes the movie, False if one cannot be hashed."""
+    from manim import config
+
+    for name in sorted(set(config) - _UNKEYED_CONFIG):
+        value = config.tex_template.body if name == "tex_template" else config[name]
+        data = _value_bytes(value)
+        if data is None:
+            return False
+        hasher.update(name.encode() + b"=" + data)
+    return True
+
+
+def scene_key(scene_class) -> tuple[str, list[str]] | None:
+    """Hash of everything a scene's movie depends on, and the files that must stay unchanged.
+
+    The key covers the AST of the scene class and its bases, the module level data,
+    helpers and repo modules they name (``data`` arrays, ``w_hidden``, ``store.resolve``...),
+    the script's module level statements that change outside state and the whole
+    manim config but for :data:`_UNKEYED_CONFIG`. The files are the repo modules a
+    scene uses in ways that cannot be narrowed to a name. So editing one scene, or a
+    threemds helper it does not use, leaves the other scenes cached. Shared
+    :class:`~threemds.scenes.CachedClip` scenes get their :meth:`clip_key` instead.
+    None when the scene cannot be fingerprinted.
+    """
+    import manim
+    from manim import Scene
+
+    clip_key = getattr(scene_class, "clip_key", None)
+    if clip_key and (key := clip_key()):
+        return key
+
+    hasher = hashlib.sha256()
+    seen, inputs = set(), set()
+    for cls in scene_class.__mro__:
+        if cls is Scene:
+            break
+        if not _fingerprint_source(cls, hasher, seen, inputs):
+            return None
+    hasher.update(manim.__version__.encode())
+    if not _fingerprint_config(hasher):
+        return None
+
+    _fingerprint_script(inspect.getfile(scene_class), hasher)
+    inputs.update(getattr(scene_class, "clip_files", list)())
+    return hasher.hexdigest(), sorted(str(Path(f).resolve()) for f in inputs)
+
+
+# files opened for reading while a scene renders, None when not recording
+_opened = None
+_audit_installed = False
+
+
+def _audit(event: str, args: tuple) -> None:
+    if _opened is not None and event == "open" and isinstance(args[0], (str, os.PathLike)) \
+            and isinstance(args[2], int) and args[2] & os.O_ACCMODE == os.O_RDONLY:
+        _opened.add(args[0])
+
+
+@contextmanager
+def _recording_opened_files():
+    """Collect the repo and asset store files opened for reading inside the block, e.g. images."""
+    global _opened, _audit_installed
+    if not _audit_installed:
+        # audit hooks cannot be removed, so the one hook stays and checks whether anyone listens
+        sys.addaudithook(_audit)
+        _audit_installed = True
+    _opened = opened = set()
+    files = []
+    try:
+        yield files
+    finally:
+        _opened = None
+        for f in opened:
+            path = Path(f).resolve()
+            if (_in_repo(path) or path.is_relative_to(STORE_DIR.resolve())) and path.suffix != ".pyc" \
+                    and path.is_file():
+                files.append(str(path))
+
+
+def _file_state(file: str) -> list:
+    stat = os.stat(file)
+    return [stat.st_size, stat.st_mtime_ns, hashlib.sha256(Path(file).read_bytes()).hexdigest()]
+
+
+def _cached_movie(key: str, suffix: str) -> Path | None:
+    """The cached movie of a scene key, if every file it was rendered from is unchanged."""
+    movie, manifest = SCENE_CACHE_DIR / f"{key}{suffix}", SCENE_CACHE_DIR / f"{key}.json"
+    if not movie.exists() or not manifest.exists():
+        return None
+    for file, (size, mtime_ns, digest) in json.loads(manifest.read_text()).items():
+        try:
+            stat = os.stat(file)
+            if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns) and _file_state(file)[2] != digest:
+                return None
+        except OSError:
+            return None
+    return movie
+
+
+def _cache_movie(key: str, movie_file: str, inputs: list[str]) -> None:
+    SCENE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = SCENE_CACHE_DIR / f"{key}.json"
+    tmp = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({f: _file_state(f) for f in sorted(set(inputs)) if Path(f).is_file()}))
+    _clone(Path(movie_file), SCENE_CACHE_DIR / f"{key}{Path(movie_file).suffix}")
+    os.replace(tmp, manifest)
+
+
+def _clone(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst``, as a reflink where the filesystem has them, replacing ``dst`` atomically.
+
+    Never a hard link: manim and :func:`concat_movies` rewrite their output in place
+    with ``ffmpeg -y``, which would rewrite every name of the inode.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if not _materialize(src, dst):
+        tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+
+
+def _encode_holds(scene) -> None:
+    """Encode static waits from one copy of the frame instead of piping it once per frame.
+
+    Manim already skips rasterizing a wait with nothing to update, but still writes the
+    frozen frame to ffmpeg ``duration * fps`` times. Here ffmpeg gets the frame once and
+    repeats it after the yuv conversion with its loop filter, using the same codec
+    settings as manim's partial movies so they still stream-copy concatenate.
+    """
+    from manim import __version__, config
+    from manim.constants import RendererType
+    from manim.utils.file_ops import is_webm_format
+
+    renderer = scene.renderer
+    freeze_current_frame = renderer.freeze_current_frame
+
+    def _freeze_current_frame(duration: float):
+        writer = renderer.file_writer
+        dt = 1 / renderer.camera.frame_rate
+        num_frames = int(duration / dt)
+        process = getattr(writer, "writing_process", None)
+        if (renderer.skip_animations or num_frames < 1 or process is None or process.stdin.closed
+                or config.renderer != RendererType.CAIRO or config.transparent or is_webm_format()):
+            return freeze_current_frame(duration)
+
+        # let go of the pipe manim opened for this wait, the hold replaces its partial movie
+        process.stdin.close()
+        process.wait()
+
+        frame = renderer.get_frame()
+        frame_file = Path(writer.partial_movie_file_path).with_suffix(".rgba")
+        frame_file.write_bytes(frame.tobytes())
+        fps = int(config.frame_rate) if config.frame_rate == int(config.frame_rate) else config.frame_rate
+        subprocess.run([config.ffmpeg_executable, "-y", "-f", "rawvideo",
+                        "-s", f"{frame.shape[1]}x{frame.shape[0]}", "-pix_fmt", "rgba", "-r", str(fps),
+                        "-i", str(frame_file), "-an", "-loglevel", config.ffmpeg_loglevel.lower(),
+                        "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+                        "-vf", f"format=yuv420p,loop=loop={num_frames - 1}:size=1:start=0",
+                        "-vcodec", "libx264", "-pix_fmt", "yuv420p", *_x264_preset(writer),
+                        str(writer.partial_movie_file_path)], check=True)
+        frame_file.unlink()
+        renderer.time += num_frames * dt
+
+    renderer.freeze_current_frame = _freeze_current_frame
+
+
+def _x264_preset(writer) -> list[str]:
+    preset = getattr(writer, "x264_preset", None)
+    return ["-preset", preset] if preset else []
+
+
+def _draft(scene) -> None:
+    """Draw ``scene`` without anti-aliasing and encode it with the fastest x264 preset, for proxies."""
+    import cairo
+    from manim import config
+    from manim.constants import RendererType
+    from manim.scene import scene_file_writer
+
+    if config.renderer != RendererType.CAIRO:
+        return
+    camera, writer = scene.renderer.camera, scene.renderer.file_writer
+    get_cairo_context, open_movie_pipe = camera.get_cairo_context, writer.open_movie_pipe
+
+    def _get_cairo_context(pixel_array):
+        ctx = get_cairo_context(pixel_array)
+        ctx.set_antialias(cairo.ANTIALIAS_NONE)
+        return ctx
+
+    def _popen(real_subprocess):
+        def _Popen(command, **kwargs):
+            if "libx264" in command:
+                command = [*command[:-1], *_x264_preset(writer), command[-1]]
+            return real_subprocess.Popen(command, **kwargs)
+        return _Popen
+
+    def _open_movie_pipe(file_path=None):
+        real_subprocess = scene_file_writer.subprocess
+        scene_file_writer.subprocess = SimpleNamespace(PIPE=real_subprocess.PIPE, Popen=_popen(real_subprocess))
+        try:
+            open_movie_pipe(file_path)
+        finally:
+            scene_file_writer.subprocess = real_subprocess
+
+    camera.get_cairo_context = _get_cairo_context
+    writer.open_movie_pipe = _open_movie_pipe
+    # holds (see _encode_holds) use the same preset, so partial movies still concatenate
+    writer.x264_preset = PROXY_PRESET
+
+
+def _record_timing(scene) -> dict:
+    """Record the run time of every play and where every ``next_section()`` starts.
+
+    Run times do not depend on resolution or on skipped rendering, so the manifest of
+    a proxy render is the one its final render has to match.
+    """
+    from manim import config
+
+    timing = {"frame_rate": config.frame_rate, "duration": 0.0,
+              "sections": [{"name": "autocreated", "start": 0.0, "play": 0}], "plays": []}
+    play, next_section = scene.play, scene.next_section
+
+    def _next_section(name="unnamed", *args, **kwargs):
+        timing["sections"].append({"name": name, "start": timing["duration"], "play": len(timing["plays"])})
+        return next_section(name, *args, **kwargs)
+
+    def _play(*args, **kwargs):
+        # play() returns early without animations, and then sets no duration
+        scene.duration = None
+        play(*args, **kwargs)
+        if scene.duration is not None:
+            names = [type(a).__name__.lstrip("_").replace("AnimationBuilder", "animate") for a in args]
+            timing["plays"].append({"section": len(timing["sections"]) - 1, "animations": names,
+                                    "seconds": round(float(scene.duration), 6)})
+            timing["duration"] = round(timing["duration"] + scene.duration, 6)
+
+    scene.play, scene.next_section = _play, _next_section
+    return timing
+
+
+def timing_file(file: str, scene_name: str) -> Path:
+    """Where the proxy render of a scene leaves its timing manifest."""
+    from manim import config
+
+    return Path(config.get_dir("media_dir")) / "timing" / Path(file).stem / f"{scene_name}.json"
+
+
+def check_timing(timing: dict, reference: dict) -> list[str]:
+    """How ``timing`` differs from the ``reference`` manifest, empty when plays and sections line up."""
+    mismatches = []
+    if timing["frame_rate"] != reference["frame_rate"]:
+        mismatches.append(f"frame rate {reference['frame_rate']} -> {timing['frame_rate']}")
+    sections = [(s["name"], s["start"], s["play"]) for s in timing["sections"]]
+    for i, (old, new) in enumerate(zip([(s["name"], s["start"], s["play"]) for s in reference["sections"]],
+                                       sections)):
+        if old != new:
+            mismatches.append(f"section {i} {old[0]!r} at {old[1]}s -> {new[0]!r} at {new[1]}s")
+    if len(reference["sections"]) != len(sections):
+        mismatches.append(f"{len(reference['sections'])} sections -> {len(sections)}")
+    for i, (old, new) in enumerate(zip(reference["plays"], timing["plays"])):
+        if old["seconds"] != new["seconds"]:
+            mismatches.append(f"play {i} ({', '.join(new['animations'])}) {old['seconds']}s -> {new['seconds']}s")
+    if len(reference["plays"]) != len(timing["plays"]):
+        mismatches.append(f"{len(reference['plays'])} plays -> {len(timing['plays'])}")
+    return mismatches
+
+
+def _timing_manifest(file: str, scene_name: str, timing: dict, proxy: str | None) -> list[str]:
+    """Save the manifest of a proxy render, or check a final render against the saved one."""
+    manifest = timing_file(file, scene_name)
+    if proxy:
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = manifest.with_name(f"{manifest.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({**timing, "proxy": proxy}, indent=1))
+        os.replace(tmp, manifest)
+        return []
+    if not manifest.exists():
+        return []
+    return check_timing(timing, json.loads(manifest.read_text()))
+
+
+def _only_section(scene, index: int) -> None:
+    """Skip every section of ``scene`` except ``index`` and end the scene after it."""
+    from manim.scene.section import DefaultSectionType
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    # the section manim creates before the first next_section() call is index 0
+    scene.renderer.file_writer.sections[-1].skip_animations = index != 0
+    current = 0
+    next_section = scene.next_section
+
+    def _next_section(name="unnamed", type=DefaultSectionType.NORMAL, skip_animations=False):
+        nonlocal current
+        current += 1
+        if current > index:
+            raise EndSceneEarlyException()
+        next_section(name, type, skip_animations or current != index)
+
+    scene.next_section = _next_section
+
+
+def _probe_sections(file: str, scene_name: str, overrides: dict,
+                    proxy: str | None = None) -> tuple[list[tuple[str, bool, int]], list[str]]:
+    """Dry run a scene, returning (name, skip_animations, plays) for each of its sections.
+
+    The timing of the dry run is the scene's timing, it is saved or checked like in
+    :func:`_render_scene`, and the mismatches come back too.
+    """
+    from manim import tempconfig
+    from manim.scene.section import DefaultSectionType
+
+    sections = [["autocreated", False, 0]]
+    with tempconfig({**overrides, "dry_run": True, "preview": False}):
+        scene = getattr(load_script(file), scene_name)()
+        scene.renderer.file_writer.sections[-1].skip_animations = True
+        next_section, play = scene.next_section, scene.play
+
+        def _next_section(name="unnamed", type=DefaultSectionType.NORMAL, skip_animations=False):
+            sections.append([name, skip_animations, 0])
+            next_section(name, type, True)
+
+        def _play(*args, **kwargs):
+            sections[-1][2] += 1
+            play(*args, **kwargs)
+
+        scene.next_section, scene.play = _next_section, _play
+        timing = _record_timing(scene)
+        scene.render()
+        mismatches = _timing_manifest(file, scene_name, timing, proxy)
+
+    return [tuple(s) for s in sections], mismatches
+
+
+def _render_scene(file: str, scene_name: str, overrides: dict, section: int | None = None,
+                  cached_only: bool = False, proxy: str | None = None) -> RenderResult:
+    """Render one scene, or one section of it, in this worker.
+
+    A whole scene whose :func:`scene_key` has a cached movie is linked into place before
+    ``construct()`` runs. With ``cached_only`` a miss renders nothing and the result
+    only carries the key. A ``proxy`` render (``overrides`` from :func:`proxy_config`)
+    is drafted, never cached, and saves the timing manifest a final render is checked
+    against.
+    """
+    from manim import config, tempconfig
+
+    from threemds.trackers import update_counts
+
+    start = time.perf_counter()
+    update_counts.clear()
+    try:
+        # module level config (e.g. config.quality) runs first, overrides win
+        scene_class = getattr(load_script(file), scene_name)
+        with tempconfig(overrides):
+            scene = scene_class()
+            _encode_holds(scene)
+            if proxy:
+                _draft(scene)
+            if section is not None:
+                _only_section(scene, section)
+
+            from threemds.profiling import PROFILE_ALLOCATIONS, PROFILE_DIR, SceneProfiler
+            profiler = SceneProfiler(scene, PROFILE_ALLOCATIONS) if PROFILE_DIR and not cached_only else None
+
+            movie_file = getattr(scene.renderer.file_writer, "movie_file_path", None)
+            key, inputs = None, []
+            # a profiled scene has to render
+            if section is None and movie_file and SCENE_CACHE and not profiler and not proxy:
+                key, inputs = scene_key(scene_class) or (None, [])
+            cached = key and _cached_movie(key, config.movie_file_extension)
+
+            output_file, mismatches = None, []
+            if cached:
+                _clone(cached, Path(movie_file))
+                output_file = str(movie_file)
+                if config.preview:
+                    from manim.utils.file_ops import open_file
+                    open_file(movie_file)
+            elif not cached_only:
+                # sections are timed by the dry run of render_sections
+                timing = _record_timing(scene) if section is None else None
+                from threemds.pipeline import output_stage
+                if profiler:
+                    profiler.install()
+                try:
+                    with _recording_opened_files() as opened, output_stage(scene):
+                        scene.render()
+                finally:
+                    # Mobject.update is patched for the whole worker, later jobs must not see it
+                    if profiler:
+                        profiler.finish()
+                inputs += opened
+                if timing:
+                    mismatches = _timing_manifest(file, scene_name, timing, proxy)
+                if profiler:
+                    name = scene_name if section is None else f"{scene_name}_section_{section:02d}"
+                    profiler.export_speedscope(Path(PROFILE_DIR) / f"{name}.speedscope.json")
+                    print(f"{name}\n{profiler.table()}")
+                # manim points output_file at whatever it wrote last
+                output_file = str(config.output_file) if config.output_file else None
+                if key and Path(movie_file).exists():
+                    _cache_movie(key, movie_file, inputs)
+    except Exception as e:
+        return RenderResult(scene_name, 1, time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+
+    return RenderResult(scene_name, 0, time.perf_counter() - start, output_file=output_file,
+                        updates_executed=update_counts["executed"], updates_skipped=update_counts["skipped"],
+                        cache_key=key, inputs=inputs, timing_mismatches=mismatches)
+
+
+def _run_jobs(jobs: list[tuple], max_workers: int | None = None) -> list[RenderResult]:
+    """Run ``_render_scene`` argument tuples in a process pool capped at the core count."""
+    max_workers = max_workers or max(1, min(len(jobs), os.cpu_count() or 1))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(_render_scene, *job) for job in jobs]
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # the worker itself died, e.g. killed for running out of memory
+                results.append(RenderResult(job[1], 1, 0.0, error=f"{type(e).__name__}: {e}"))
+    return results
+
+
+def concat_movies(movie_files: list[str], output_file: str) -> None:
+    """Stream-copy concatenate movies with ffmpeg's concat demuxer, like manim's own partial movies."""
+    from manim import config
+
+    output_file = Path(output_file)
+    file_list = output_file.with_suffix(".txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        for movie_file in movie_files:
+            fp.write(f"file 'file:{Path(movie_file).resolve().as_posix()}'\n")
+
+    subprocess.run([config.ffmpeg_executable, "-y", "-loglevel", "error", "-nostdin",
+                    "-f", "concat", "-safe", "0", "-i", str(file_list),
+                    "-c", "copy", str(output_file)], check=True)
+    file_list.unlink()
+
+
+def print_results(results: list[RenderResult]) -> None:
+    for r in results:
+        status = "ok" if r.ok else f"FAILED ({r.error})"
+        if r.updates_executed or r.updates_skipped:
+            status += f"  updates: {r.updates_executed} run, {r.updates_skipped} skipped"
+        print(f"{r.scene_name:<32} {r.seconds:8.1f}s  {status}")
+        for mismatch in r.timing_mismatches:
+            print(f"{'':<32} timing differs from the proxy: {mismatch}")
+
+
+def render_scenes(q: str | None = None,
+                  scene_names: list[str] = (),
+                  file: str | None = None,
+                  max_workers: int | None = None,
+                  proxy: str | None = PROXY,
+                  **config_overrides) -> list[RenderResult]:
+    """Render scenes from a script in parallel, one scene per worker process.
+
+    ``q`` is the manim quality flag (l, m, h, p or k) and defaults to whatever the
+    script configures. ``file`` defaults to the calling script. Any other keyword is
+    passed on to manim's config. Results come back in ``scene_names`` order.
+
+    ``proxy`` names one of :data:`PROXIES` to render a fast preview at that frame size
+    instead, at the same frame rate and without anti-aliasing. Its timing manifest is
+    saved, and later full renders report any play or section that no longer lines up.
+    """
+    if file is None:
+        file = inspect.currentframe().f_back.f_code.co_filename
+
+    overrides = scene_config(file, q, **config_overrides)
+    if proxy:
+        overrides = proxy_config(overrides, proxy)
+    results = _run_jobs([(file, name, overrides, None, False, proxy) for name in scene_names], max_workers)
+
+    print_results(results)
+    return results
+
+
+def render_sections(scene_name: str,
+                    q: str | None = None,
+                    file: str | None = None,
+                    max_workers: int | None = None,
+                    proxy: str | None = PROXY,
+                    **config_overrides) -> RenderResult:
+    """Render each ``next_section()`` of a long scene in its own worker process.
+
+    Every worker replays the scene with ``skip_animations`` up to its section, renders
+    that section alone, and stops. The section movies are then stream-copy concatenated
+    into the same movie a serial render would produce. Sections marked
+    ``skip_animations=True`` in the scene stay skipped.
+
+    Replaying relies on the scene state after a skipped animation matching the rendered
+    one, which holds unless an updater depends on ``dt``. ``proxy`` works like in
+    :func:`render_scenes`.
+    """
+    from manim import config
+
+    if file is None:
+        file = inspect.currentframe().f_back.f_code.co_filename
+
+    start = time.perf_counter()
+    overrides = scene_config(file, q, **config_overrides)
+    if proxy:
+        overrides = proxy_config(overrides, proxy)
+    output_name = Path(overrides.get("output_file") or scene_name).stem
+
+    try:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            cached = pool.submit(_render_scene, file, scene_name, overrides, None, True, proxy).result()
+            if cached.output_file:
+                print_results([cached])
+                return cached
+            sections, mismatches = pool.submit(_probe_sections, file, scene_name, overrides, proxy).result()
+    except Exception as e:
+        result = RenderResult(scene_name, 1, time.perf_counter() - start, error=f"{type(e).__name__}: {e}")
+        print_results([result])
+        return result
+
+    indices = [i for i, (_, skip, plays) in enumerate(sections) if plays and not skip]
+    jobs = [(file, scene_name, {**overrides,
+                                "output_file": f"{output_name}_section_{i:02d}",
+                                "partial_movie_dir": f"{config.partial_movie_dir}/section_{i:02d}",
+                                "preview": False}, i, False, proxy)
+            for i in indices]
+    results = _run_jobs(jobs, max_workers)
+    for i, r in zip(indices, results):
+        r.scene_name = f"{scene_name}[{i}] {sections[i][0]}"
+
+    result = RenderResult(scene_name, 0, 0.0, timing_mismatches=mismatches,
+                          updates_executed=sum(r.updates_executed for r in results),
+                          updates_skipped=sum(r.updates_skipped for r in results))
+    if not results or not all(r.ok and r.output_file for r in results):
+        result.exit_status, result.error = 1, "section render failed"
+    else:
+        section_files = [r.output_file for r in results]
+        result.output_file = str(Path(section_files[0]).with_name(output_name + Path(section_files[0]).suffix))
+        try:
+            concat_movies(section_files, result.output_file)
+            for section_file in section_files:
+                os.remove(section_file)
+            if cached.cache_key:
+                _cache_movie(cached.cache_key, result.output_file,
+                             [*cached.inputs, *(f for r in results for f in r.inputs)])
+            if overrides.get("preview", config.preview):
+                from manim.utils.file_ops import open_file
+                open_file(result.output_file)
+        except (OSError, subprocess.CalledProcessError) as e:
+            result.exit_status, result.error = 1, f"{type(e).__name__}: {e}"
+    result.seconds = time.perf_counter() - start
+
+    print_results([*results, result])
+    return result